@@ -933,6 +933,72 @@ def test_metalink2netcdf_process(metalink_version, metalink_ext, test_index):
                 assert not os.path.isfile(nc_out_path)
 
 
+METALINK_V3_FILES = """<?xml version="1.0" encoding="UTF-8"?>
+<metalink version="3.0" xmlns="http://www.metalinker.org/">
+  <files>
+    <file name="file1.nc"><resources><url type="http">https://fake-server.com/file1.nc</url></resources></file>
+    <file name="file2.nc"><resources><url type="http">https://fake-server.com/file2.nc</url></resources></file>
+  </files>
+</metalink>
+"""
+METALINK_V4_FILES = """<?xml version="1.0" encoding="UTF-8"?>
+<metalink xmlns="urn:ietf:params:xml:ns:metalink">
+  <file name="file1.nc"><metaurl mediatype="application/x-netcdf">https://fake-server.com/file1.nc</metaurl></file>
+  <file name="file2.nc"><metaurl mediatype="application/x-netcdf">https://fake-server.com/file2.nc</metaurl></file>
+</metalink>
+"""
+METALINK_NO_NAMESPACE = """<?xml version="1.0" encoding="UTF-8"?>
+<metalink version="3.0">
+  <files>
+    <file name="file1.nc"><resources><url>https://fake-server.com/file1.nc</url></resources></file>
+    <file name="file2.nc"><resources><url>https://fake-server.com/file2.nc</url></resources></file>
+  </files>
+</metalink>
+"""
+METALINK_SPLIT_TEXT = """<?xml version="1.0" encoding="UTF-8"?>
+<metalink xmlns="urn:ietf:params:xml:ns:metalink">
+  <file name="file1.nc"><metaurl>https://fake-server.com/<b>data</b>/file1.nc</metaurl></file>
+</metalink>
+"""
+
+
+@pytest.mark.parametrize(
+    ["metalink_xml", "metalink_ext", "test_index", "expect_url"],
+    [
+        (METALINK_V3_FILES, ".metalink", 1, "https://fake-server.com/file1.nc"),
+        (METALINK_V3_FILES, ".metalink", 2, "https://fake-server.com/file2.nc"),
+        (METALINK_V4_FILES, ".meta4", 1, "https://fake-server.com/file1.nc"),
+        (METALINK_V4_FILES, ".meta4", 2, "https://fake-server.com/file2.nc"),
+        # v4 detected by version attribute without the extension hint
+        (METALINK_V4_FILES.replace("<metalink ", '<metalink version="4.0" '), ".xml", 2,
+         "https://fake-server.com/file2.nc"),
+        (METALINK_NO_NAMESPACE, ".metalink", 2, "https://fake-server.com/file2.nc"),
+        (METALINK_SPLIT_TEXT, ".meta4", 1, "https://fake-server.com/data/file1.nc"),
+        (METALINK_V3_FILES, ".metalink", 3, ""),
+        (METALINK_V4_FILES, ".meta4", 3, ""),
+    ]
+)
+def test_metalink2netcdf_find_file_url(metalink_xml, metalink_ext, test_index, expect_url):
+    with tempfile.NamedTemporaryFile(mode="w", suffix=metalink_ext) as tmp_meta:
+        tmp_meta.write(metalink_xml)
+        tmp_meta.flush()
+        url = metalink2netcdf.find_metalink_file_url(tmp_meta.name, test_index)
+    assert url == expect_url
+
+
+def test_metalink2netcdf_index_out_of_range():
+    with contextlib.ExitStack() as stack:
+        tmp_meta = stack.enter_context(tempfile.NamedTemporaryFile(mode="w", suffix=".meta4"))
+        tmp_meta.write(METALINK_V4_FILES)
+        tmp_meta.flush()
+        tmp_out_dir = stack.enter_context(tempfile.TemporaryDirectory())
+
+        with pytest.raises(ValueError) as err:
+            metalink2netcdf.main("-i", tmp_meta.name, "-n", "3", "-o", tmp_out_dir)
+        assert "not a valid NetCDF" in str(err.value)
+        assert not os.listdir(tmp_out_dir)
+
+
 def test_metalink2netcdf_reference_not_netcdf():
     with contextlib.ExitStack() as stack:
         metafile = MetaFile(fmt=get_format(ContentType.APP_NETCDF))
@@ -64,6 +64,7 @@ from weaver.processes.convert import (
     cwl2json_input_values,
     cwl2wps_io,
     get_cwl_io_type,
+    get_field,
     get_io_type_category,
     is_cwl_complex_type,
     json2oas_io,
@@ -2400,3 +2401,27 @@ def test_ows2json_output_data(value, dtype, ctype, expect):
 )
 def test_convert_value_units_literal_uom(value, uom, to, expected):
     assert convert_value_units(value, uom, to) == expected
+
+
+@pytest.mark.parametrize(
+    ["io_object", "field", "options", "expected"],
+    [
+        ({"identifier": "a", "id": "b"}, "identifier", {}, "a"),
+        ({"id": "b"}, "identifier", {}, null),
+        ({"id": "b"}, "identifier", {"search_variations": True}, "b"),
+        ({"id": "b"}, "identifier", {"search_variations": True, "key": True}, "id"),
+        ({"identifier": "a", "ID": "c"}, "identifier", {"search_variations": True, "only_variations": True}, "c"),
+        ({"other": "d", "id": "b"}, "identifier", {"extra_variations": ["other"]}, "d"),
+        ({}, "identifier", {"search_variations": True, "default": "x"}, "x"),
+    ]
+)
+def test_get_field(io_object, field, options, expected):
+    assert get_field(io_object, field, **options) == expected
+
+
+def test_get_field_pop_found_variation():
+    data = {"id": "b", "title": "t"}
+    extra = ["Identifier"]
+    assert get_field(data, "identifier", search_variations=True, extra_variations=extra, pop_found=True) == "b"
+    assert data == {"title": "t"}
+    assert extra == ["Identifier"], "extra variations provided by caller should not be modified"
@@ -1,4 +1,5 @@
 import json
+import os
 
 import mock
 import pytest
@@ -8,6 +9,8 @@ from requests.models import Request, Response
 from weaver.exceptions import PackageExecutionError
 from weaver.formats import ContentType
 from weaver.processes.wps3_process import Wps3Process
+from weaver.processes.wps_process_base import WpsProcessInterface
+from weaver.utils import OutputMethod
 from weaver.visibility import Visibility
 
 
@@ -84,3 +87,70 @@ def test_wps3_process_step_io_data_or_href():
                     pytest.fail(msg)
                 msg = f"Other error was raised [{exc}], inputs where not correctly handled somewhere"
                 pytest.fail(msg)
+
+
+def test_wps_process_stage_results_same_destination_last_value(tmpdir):
+    """
+    Validates that result values resolving to the same staged file preserve the last one, as if fetched sequentially.
+
+    Remote files are fetched concurrently, which must not write simultaneously to the same destination file, even when
+    their name cannot be known in advance (e.g.: ``Content-Disposition`` or query parameters). Directories are fetched
+    sequentially, without any collision between them.
+    """
+    out_dir = str(tmpdir)
+    results = [
+        {"id": "output", "href": [
+            "https://first.com/data/file.txt",
+            "https://second.com/data/file.txt",
+            "https://other.com/data/other.txt",
+            "https://files.com/download?id=1",
+            "https://files.com/download?id=2",
+            "https://remote.com/data/dir1/",
+            "https://remote.com/data/dir2/",
+            "https://remote.com/data/linked.txt",
+            "https://localhost/wpsoutputs/linked.txt",
+        ]},
+    ]
+
+    def mock_map_location(value, *_, **__):
+        if value.startswith("https://localhost/wpsoutputs/"):
+            return value.replace("https://localhost/wpsoutputs", "/tmp/wpsoutputs")
+        return None
+
+    def mock_fetch(src, dst_dir, *_, **__):
+        if src.endswith("/"):
+            path = os.path.join(dst_dir, src.rstrip("/").rsplit("/", 1)[-1])
+            os.makedirs(path)
+            return path
+        name = "download.bin" if "?" in src else src.rsplit("/", 1)[-1]  # simulate 'Content-Disposition' naming
+        path = os.path.join(dst_dir, name)
+        with open(path, mode="w", encoding="utf-8") as file:
+            file.write(src)
+        return path
+
+    mock_process = mock.MagicMock(settings={})
+    with mock.patch("weaver.processes.wps_process_base.map_wps_output_location", side_effect=mock_map_location):
+        with mock.patch("weaver.processes.wps_process_base.fetch_reference", side_effect=mock_fetch) as mocked_fetch:
+            WpsProcessInterface.stage_results(mock_process, results, {"output": {}}, out_dir)
+
+    fetched = [(call.args[0], call.kwargs["out_method"]) for call in mocked_fetch.call_args_list]
+    assert len(fetched) == len(results[0]["href"]), "All values should be fetched, none skipped"
+    sequential = [fetch for fetch in fetched if fetch[0].endswith("/") or fetch[1] == OutputMethod.LINK]
+    assert sequential == [
+        ("https://remote.com/data/dir1/", OutputMethod.COPY),
+        ("https://remote.com/data/dir2/", OutputMethod.COPY),
+        ("/tmp/wpsoutputs/linked.txt", OutputMethod.LINK),
+    ]
+
+    def read(name):
+        with open(os.path.join(out_dir, "output", name), mode="r", encoding="utf-8") as file:
+            return file.read()
+
+    assert sorted(os.listdir(out_dir)) == ["output"], "Temporary fetch directories should have been removed"
+    assert sorted(os.listdir(os.path.join(out_dir, "output"))) == [
+        "dir1", "dir2", "download.bin", "file.txt", "linked.txt", "other.txt"
+    ]
+    assert read("file.txt") == "https://second.com/data/file.txt"
+    assert read("download.bin") == "https://files.com/download?id=2"
+    assert read("other.txt") == "https://other.com/data/other.txt"
+    assert read("linked.txt") == "/tmp/wpsoutputs/linked.txt"
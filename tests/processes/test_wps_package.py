@@ -14,6 +14,7 @@ import re
 import shutil
 import sys
 import tempfile
+import threading
 import warnings
 from typing import TYPE_CHECKING
 
@@ -23,6 +24,7 @@ import pytest
 from _pytest.outcomes import Failed
 from cwltool.errors import WorkflowException
 from cwltool.factory import Factory as CWLFactory
+from pyramid import testing
 
 from tests.utils import assert_equal_any_order
 from weaver.datatype import Process
@@ -36,7 +38,16 @@ from weaver.processes.constants import (
     CWL_REQUIREMENT_PROCESS_GENERATOR,
     CWL_REQUIREMENT_TIME_LIMIT
 )
-from weaver.processes.wps_package import WpsPackage, _load_package_content, _update_package_compatibility
+from weaver.processes.wps_package import (
+    WpsPackage,
+    _fetch_package_steps,
+    _load_package_content,
+    _load_package_steps,
+    _update_package_compatibility,
+    _update_package_metadata
+)
+from weaver.status import Status
+from weaver.utils import get_settings
 from weaver.wps.service import WorkerRequest
 
 if TYPE_CHECKING:
@@ -268,6 +279,62 @@ def test_stdout_stderr_logging_for_commandline_tool_exception(caplog):
         pytest.fail("\"wps_package._handler()\" was expected to throw \"PackageExecutionError\" exception")
 
 
+@pytest.mark.parametrize("fail_status_update", [False, True])
+def test_package_log_handlers_removed_after_execution(fail_status_update):
+    """
+    Validate that the job log file handler is not left on shared loggers once the package execution completes.
+
+    Handlers must be removed even if the final status update itself fails.
+    """
+    with contextlib.ExitStack() as stack:
+        xml_file = stack.enter_context(tempfile.NamedTemporaryFile(suffix=".xml"))  # noqa
+        workdir = stack.enter_context(tempfile.TemporaryDirectory())
+        process = MockProcess(shell_command="echo", with_message_input=True)
+        wps_package_instance = MockWpsPackage(identifier=process["id"], title=process["title"],
+                                              payload=process, package=process["package"])
+        wps_package_instance.settings = {}
+        wps_package_instance.mock_status_location = xml_file.name
+        wps_package_instance.set_workdir(workdir)
+        wps_request = MockWpsRequest(process_id=process["id"], with_message_input=False)
+        wps_response = type("", (object,), {"_update_status": lambda *_, **__: 1})()
+
+        loggers = [
+            logging.getLogger(f"weaver.processes.wps_package|{process['id']}"),
+            logging.getLogger("job package"),
+            logging.getLogger("cwltool"),
+            logging.getLogger("weaver.tweens"),
+        ]
+        handlers = [list(logger.handlers) for logger in loggers]
+        expect_error = PackageExecutionError
+        if fail_status_update:
+            update_status = wps_package_instance.update_status
+
+            def mock_update_status(message, progress, status, *_, **__):
+                if status == Status.FAILED:
+                    raise ValueError("Failed status update.")
+                return update_status(message, progress, status, *_, **__)
+
+            stack.enter_context(mock.patch.object(wps_package_instance, "update_status", mock_update_status))
+            expect_error = ValueError
+        with pytest.raises(expect_error):
+            wps_package_instance._handler(wps_request, wps_response)
+        assert [list(logger.handlers) for logger in loggers] == handlers
+
+
+def test_update_package_metadata_schemas():
+    package = {
+        "$namespaces": {"s": "https://schema.org/", "edam": "http://edamontology.org/"},
+        "$schemas": ["https://schema.org/version/latest/schemaorg-current-https.rdf", "https://example.com/other.rdf"],
+        "s:keywords": ["test", "other", "more"],
+    }
+    metadata = {"keywords": ["more", "first"]}
+    _update_package_metadata(metadata, package)
+    assert metadata["metadata"] == [
+        {"title": "s", "href": "https://schema.org/version/latest/schemaorg-current-https.rdf"},
+    ]
+    assert metadata["keywords"] == ["more", "first", "test", "other"]
+
+
 def _combine(dict1, dict2):
     # type: (Dict[KT, VT_co], Dict[KT, VT_co]) -> Dict[KT, VT_co]
     dict1 = dict1.copy()
@@ -559,3 +626,128 @@ def test_cwl_enum_schema_name_patched():
         tool(test=None)
         tool(test=test_symbols[0])
         tool(test=[test_symbols[0]])
+
+
+def make_step_workflow(**steps):
+    # type: (**str) -> CWL
+    return {
+        "cwlVersion": "v1.2",
+        "class": "Workflow",
+        "inputs": {},
+        "outputs": {},
+        "steps": {step: {"run": run, "in": {}, "out": []} for step, run in steps.items()},
+    }
+
+
+def make_step_application():
+    # type: () -> CWL
+    return {
+        "cwlVersion": "v1.2",
+        "class": "CommandLineTool",
+        "baseCommand": "echo",
+        "inputs": {},
+        "outputs": {},
+    }
+
+
+def mock_process_packages(packages):
+    # type: (Dict[str, CWL]) -> mock.MagicMock
+    """
+    Mocks retrieval of step packages from the process locations, returning a copy to simulate distinct responses.
+    """
+    def mock_get_process_package(process_url):
+        return copy.deepcopy(packages[process_url]), process_url.rsplit("/", 1)[-1]
+
+    return mock.patch(
+        "weaver.processes.wps_package._get_process_package",
+        side_effect=mock_get_process_package,
+    )
+
+
+def test_load_package_steps_shared_and_nested():
+    """
+    Validate that step packages shared by multiple steps and sub-workflows are retrieved once and dumped with updates.
+    """
+    url = "https://example.com/processes"
+    packages = {
+        f"{url}/app-shared": make_step_application(),
+        f"{url}/app-nested": make_step_application(),
+        f"{url}/sub-workflow": make_step_workflow(nested1=f"{url}/app-shared", nested2=f"{url}/app-nested"),
+    }
+    package = make_step_workflow(step1=f"{url}/app-shared", step2=f"{url}/app-shared", step3=f"{url}/sub-workflow")
+
+    with contextlib.ExitStack() as stack:
+        tmp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        mocked_get_package = stack.enter_context(mock_process_packages(packages))
+        steps = _load_package_steps(package, None, tmp_dir)
+
+        fetched_urls = sorted(call.args[0] for call in mocked_get_package.call_args_list)
+        assert fetched_urls == sorted(packages), "Each step package should be retrieved only once"
+        assert sorted(os.listdir(tmp_dir)) == ["app-nested", "app-shared", "sub-workflow"]
+        with open(os.path.join(tmp_dir, "sub-workflow"), mode="r", encoding="utf-8") as sub_file:
+            sub_workflow = json.load(sub_file)
+
+    assert {step: info["run"] for step, info in sub_workflow["steps"].items()} == {
+        "nested1": "app-shared",
+        "nested2": "app-nested",
+    }, "Nested sub-workflow should refer to dumped step packages"
+    assert {step: info["run"] for step, info in package["steps"].items()} == {
+        "step1": "app-shared",
+        "step2": "app-shared",
+        "step3": "sub-workflow",
+    }
+    assert set(steps) == {"step1", "step2", "step3"}, "Only direct steps of the workflow should be returned"
+    assert {step: info["id"] for step, info in steps.items()} == {
+        "step1": "app-shared",
+        "step2": "app-shared",
+        "step3": "sub-workflow",
+    }
+    assert steps["step3"]["package"]["class"] == "Workflow"
+
+
+def test_load_package_steps_cyclic_reference():
+    """
+    Validate that sub-workflows referring to each other do not cause infinite loading of their steps.
+    """
+    url = "https://example.com/processes"
+    packages = {
+        f"{url}/workflow-a": make_step_workflow(step_b=f"{url}/workflow-b"),
+        f"{url}/workflow-b": make_step_workflow(step_a=f"{url}/workflow-a"),
+    }
+    package = make_step_workflow(step=f"{url}/workflow-a")
+
+    with contextlib.ExitStack() as stack:
+        tmp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        mocked_get_package = stack.enter_context(mock_process_packages(packages))
+        steps = _load_package_steps(package, None, tmp_dir)
+        assert mocked_get_package.call_count == 2
+        assert sorted(os.listdir(tmp_dir)) == ["workflow-a", "workflow-b"]
+
+    assert list(steps) == ["step"]
+    assert steps["step"]["package"]["steps"]["step_b"]["run"] == "workflow-b"
+
+
+def test_fetch_package_steps_concurrent_thread_locals():
+    """
+    Validate that concurrent retrieval of step packages resolves the application settings of the calling context.
+    """
+    url = "https://example.com/processes"
+    step_urls = [f"{url}/app-{i}" for i in range(10)]
+    resolved = {}
+
+    def mock_get_process_package(process_url):
+        resolved[process_url] = (get_settings().get("weaver.test_setting"), threading.get_ident())
+        return make_step_application(), process_url.rsplit("/", 1)[-1]
+
+    config = testing.setUp(settings={"weaver.test_setting": "test-value"})
+    try:
+        with mock.patch("weaver.processes.wps_package._get_process_package", side_effect=mock_get_process_package):
+            results = _fetch_package_steps(step_urls)
+        assert get_settings(config).get("weaver.test_setting") == "test-value", "Caller context should be preserved"
+    finally:
+        testing.tearDown()
+
+    assert [name for _, name in results] == [f"app-{i}" for i in range(10)], "Results should preserve URL order"
+    assert sorted(resolved) == sorted(step_urls)
+    assert all(setting == "test-value" for setting, _ in resolved.values()), "Workers should resolve caller settings"
+    assert all(ident != threading.get_ident() for _, ident in resolved.values()), "Retrieval should use workers"
@@ -1,10 +1,11 @@
 import uuid
 from copy import deepcopy
+from datetime import datetime
 
 import pytest
 
 from tests import resources
-from weaver.datatype import Authentication, AuthenticationTypes, DockerAuthentication, Process
+from weaver.datatype import Authentication, AuthenticationTypes, DockerAuthentication, Process, Quote
 from weaver.execute import ExecuteControlOption
 
 
@@ -206,3 +207,15 @@ def test_process_io_schema_ignore_uri():
 ])
 def test_process_split_version(process_id, result):
     assert Process.split_version(process_id) == result
+
+
+@pytest.mark.parametrize("value", [
+    "2023-01-02T03:04:05+00:00",
+    "2023-01-02 03:04:05+00:00",
+    "Mon, 02 Jan 2023 03:04:05 +0000",  # not ISO-8601, requires the permissive parser
+])
+def test_quote_datetime_from_string(value):
+    quote = Quote(process="test")
+    quote.created = value
+    assert isinstance(quote.created, datetime)
+    assert quote.created.isoformat() == "2023-01-02T03:04:05+00:00"
@@ -1,4 +1,3 @@
-import contextlib
 import datetime
 import inspect
 import itertools
@@ -9,6 +8,7 @@ import pytest
 from pyramid.httpexceptions import HTTPOk, HTTPRequestTimeout
 from pyramid.response import Response
 from pywps.inout.formats import Format
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError
 
 from weaver import formats as f
@@ -265,6 +265,7 @@ def test_get_cwl_file_format_default():
     assert res == iana_url + fmt
 
 
+@mock.patch.dict("weaver.formats._CWL_FILE_FORMAT_CACHE", clear=True)
 def test_get_cwl_file_format_retry_attempts():
     """
     Verifies that failing request will not immediately fail the MIME-type validation.
@@ -276,31 +277,85 @@ def test_get_cwl_file_format_retry_attempts():
         m_resp.status_code = codes["codes"].pop()
         return m_resp
 
+    media_type = "image/webp"  # not statically registered, must be validated with requests
     with mock.patch("weaver.utils.get_settings", return_value={"cache.request.enabled": "false"}):
         with mock.patch("requests.Session.request", side_effect=mock_request_extra) as mocked_request:
-            _, fmt = f.get_cwl_file_format(f.ContentType.IMAGE_PNG)
-            assert fmt == f"{f.IANA_NAMESPACE}:{f.ContentType.IMAGE_PNG}"
+            _, fmt = f.get_cwl_file_format(media_type)
+            assert fmt == f"{f.IANA_NAMESPACE}:{media_type}"
             assert mocked_request.call_count == 2
 
 
-def test_get_cwl_file_format_retry_fallback_urlopen():
+@mock.patch.dict("weaver.formats._CWL_FILE_FORMAT_CACHE", clear=True)
+def test_get_cwl_file_format_retry_fallback_session():
     """
     Verifies that failing request because of critical error still validate the MIME-type using the fallback.
     """
     def mock_connect_error(*_, **__):
         raise ConnectionError()
 
-    @contextlib.contextmanager
-    def mock_urlopen(*_, **__):
-        yield HTTPOk()
+    def mock_session_head(*_, **__):
+        m_resp = Response()
+        m_resp.status_code = HTTPOk.code
+        return m_resp
 
+    media_type = "image/webp"  # not statically registered, must be validated with requests
     with mock.patch("weaver.utils.get_settings", return_value={"cache.request.enabled": "false"}):
         with mock.patch("requests.Session.request", side_effect=mock_connect_error) as mocked_request:
-            with mock.patch("weaver.formats.urlopen", side_effect=mock_urlopen) as mocked_urlopen:
-                _, fmt = f.get_cwl_file_format(f.ContentType.IMAGE_PNG)
-                assert fmt == f"{f.IANA_NAMESPACE}:{f.ContentType.IMAGE_PNG}"
+            with mock.patch.object(f.get_iana_session(), "head", side_effect=mock_session_head) as mocked_head:
+                _, fmt = f.get_cwl_file_format(media_type)
+                assert fmt == f"{f.IANA_NAMESPACE}:{media_type}"
                 assert mocked_request.call_count == 4, "Expected internally attempted 4 times (1 attempt + 3 retries)"
-                assert mocked_urlopen.call_count == 1, "Expected internal fallback request calls"
+                assert mocked_head.call_count == 1, "Expected internal fallback request calls"
+
+
+@mock.patch.dict("weaver.formats._CWL_FILE_FORMAT_CACHE", clear=True)
+def test_get_cwl_file_format_failed_validation_not_memoized():
+    """
+    Verifies that a media-type that could not be validated because of connection errors is resolved on a later call.
+    """
+    def mock_connect_error(*_, **__):
+        raise ConnectionError()
+
+    def mock_session_head(*_, **__):
+        m_resp = Response()
+        m_resp.status_code = HTTPOk.code
+        return m_resp
+
+    media_type = "image/webp"  # not statically registered, must be validated with requests
+    with mock.patch("weaver.utils.get_settings", return_value={"cache.request.enabled": "false"}):
+        with mock.patch("requests.Session.request", side_effect=mock_connect_error):
+            with mock.patch.object(f.get_iana_session(), "head", side_effect=mock_connect_error):
+                res = f.get_cwl_file_format(media_type)
+                assert res == (None, None)
+            with mock.patch.object(f.get_iana_session(), "head", side_effect=mock_session_head) as mocked_head:
+                _, fmt = f.get_cwl_file_format(media_type)
+                assert fmt == f"{f.IANA_NAMESPACE}:{media_type}"
+                assert mocked_head.call_count == 1
+            with mock.patch.object(f.get_iana_session(), "head", side_effect=mock_connect_error) as mocked_head:
+                _, fmt = f.get_cwl_file_format(media_type)
+                assert fmt == f"{f.IANA_NAMESPACE}:{media_type}", "Successful resolution should be memoized"
+                assert mocked_head.call_count == 0
+
+
+def test_get_cwl_file_format_fallback_session_reused():
+    """
+    Verifies that the fallback validation of MIME-types reuses the same pooled session across lookups.
+    """
+    session = f.get_iana_session()
+    assert f.get_iana_session() is session
+    adapter = session.get_adapter(f.IANA_NAMESPACE_URL)
+    assert isinstance(adapter, HTTPAdapter)
+    assert f.get_iana_session().get_adapter(f.IANA_NAMESPACE_URL) is adapter, "Pooled adapter should be reused"
+
+
+def test_get_cwl_file_format_registered_without_request():
+    """
+    Verifies that known IANA Media-Types are resolved without any request to validate their existence.
+    """
+    with mock.patch("requests.Session.request") as mocked_request:
+        _, fmt = f.get_cwl_file_format(f.ContentType.IMAGE_PNG)
+        assert fmt == f"{f.IANA_NAMESPACE}:{f.ContentType.IMAGE_PNG}"
+        assert mocked_request.call_count == 0
 
 
 def test_get_cwl_file_format_synonym():
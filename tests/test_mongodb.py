@@ -3,12 +3,15 @@ Based on unittests in https://github.com/wndhydrnt/python-oauth2/tree/master/oau
 """
 
 import unittest
+import uuid
 
 import mock
 from pymongo.collection import Collection
 
-from weaver.datatype import Service
-from weaver.store.mongodb import MongodbServiceStore
+from weaver.datatype import Job, Service
+from weaver.status import Status
+from weaver.store.mongodb import MongodbJobStore, MongodbServiceStore
+from weaver.utils import now
 
 
 class MongodbServiceStoreTestCase(unittest.TestCase):
@@ -71,3 +74,73 @@ class MongodbServiceStoreTestCase(unittest.TestCase):
         store.save_service(Service(self.service_public))
 
         collection_mock.insert_one.assert_called_with(self.service_public)
+
+
+class MongodbJobStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.job = Job({
+            "id": str(uuid.uuid4()),
+            "task_id": str(uuid.uuid4()),
+            "process": "test-process",
+            "status": Status.SUCCEEDED,
+            "status_message": "Job succeeded.",
+            "progress": 100,
+            "access": "public",
+            "started": now(),
+            "finished": now(),
+            "updated": now(),
+            "inputs": [{"id": "input", "data": "x" * 1024}],
+            "outputs": [{"id": "output"}],
+            "results": [{"id": "output", "href": "http://somewhere.over.the/ocean/output.txt"}],
+            "exceptions": [],
+            "logs": [f"log line {i}" for i in range(100)],
+            "statistics": {"outputs": {"output": {"size": 1024}}},
+            "request": "<wps:Execute />",
+            "response": "<wps:ExecuteResponse />",
+        })
+        self.settings = {"weaver.url": "http://localhost", "weaver.wps_restapi_path": "/"}
+
+    def find_jobs_projected(self, **kwargs):
+        """
+        Finds jobs from a mocked collection that applies the top-level ``$project`` exclusions of the pipeline.
+        """
+        def aggregate(pipeline):
+            doc = dict(self.job)
+            for step in pipeline:
+                for field, keep in step.get("$project", {}).items():
+                    if not keep:
+                        doc.pop(field, None)
+            return [{"items": [doc], "total": 1}]
+
+        collection_mock = mock.Mock(spec=Collection)
+        collection_mock.aggregate.side_effect = aggregate
+        store = MongodbJobStore(collection=collection_mock)
+        jobs, total = store.find_jobs(**kwargs)
+        pipeline = collection_mock.aggregate.call_args[0][0]
+        return jobs, total, pipeline
+
+    def test_find_jobs_summary_omits_details(self):
+        jobs, total, pipeline = self.find_jobs_projected(summary=True)
+        assert total == 1
+        assert {"$project": {field: False for field in MongodbJobStore.job_details_fields}} in pipeline
+        job = jobs[0]
+        for field in ["inputs", "outputs", "results", "exceptions", "logs", "statistics", "request", "response"]:
+            assert field not in job, f"Expected large job field '{field}' to be omitted from summary listing."
+        assert job.id == self.job.id
+        assert job.status == Status.SUCCEEDED
+
+        # job status representation must not depend on the omitted fields
+        job_json = job.json(self.settings)
+        expect_json = self.job.json(self.settings)
+        assert job_json == expect_json
+        job_links = job.links(self.settings, self_link="status")
+        assert job_links == self.job.links(self.settings, self_link="status")
+        assert any(link["rel"] == "logs" for link in job_links)
+
+    def test_find_jobs_no_summary_keeps_details(self):
+        jobs, _, pipeline = self.find_jobs_projected(summary=False)
+        assert not any("$project" in step for step in pipeline)
+        job = jobs[0]
+        assert job.logs == self.job.logs
+        assert job["results"] == self.job["results"]
+        assert job.inputs == self.job.inputs
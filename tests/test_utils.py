@@ -76,9 +76,11 @@ from weaver.utils import (
     get_url_without_query,
     is_update_version,
     is_valid_url,
+    load_file,
     localize_datetime,
     make_dirs,
     null,
+    parse_datetime,
     parse_kvp,
     parse_number_with_unit,
     parse_prefer_header_execute_mode,
@@ -89,6 +91,7 @@ from weaver.utils import (
     resolve_s3_reference,
     retry_on_condition,
     str2bytes,
+    transform_json,
     validate_s3,
     xml_path_elements,
     xml_strip_ns
@@ -695,6 +698,26 @@ def test_request_extra_zero_values():
     assert sleep_counter["called_count"] == 3  # first direct call doesn't have any sleep from retry
 
 
+def test_request_extra_backoff_jitter():
+    """
+    Test that delays computed from ``backoff`` are randomized within expected bounds for each retry.
+    """
+    def mock_request(*_, **__):
+        m_resp = Response()
+        m_resp.status_code = HTTPGatewayTimeout.code
+        return m_resp
+
+    sleep_delays = []
+    with mock.patch("requests.Session.request", side_effect=mock_request):
+        with mock.patch("weaver.utils.time.sleep", side_effect=sleep_delays.append):
+            resp = request_extra("get", "http://whatever", backoff=1, retries=4, cache_enabled=False)
+    assert resp.status_code == HTTPGatewayTimeout.code
+    assert len(sleep_delays) == 4
+    for retry, delay in enumerate(sleep_delays):
+        max_delay = 2 ** (retry + 1)
+        assert max_delay / 2 <= delay <= max_delay
+
+
 @pytest.mark.parametrize("cache_enabled", [False, True])
 def test_request_extra_cache_requests_applied(cache_enabled):
     def mock_request(*_, **__):
@@ -2023,6 +2046,18 @@ def test_localize_datetime():
     assert dt_est_tz.timetuple()[:6] == (2000, 10, 10, 1, 12, 50)
 
 
+@pytest.mark.parametrize("value", [
+    "2000-10-10T06:12:50+00:00",
+    "2000-10-10 06:12:50Z",
+    "Tue, 10 Oct 2000 06:12:50 GMT",  # not ISO-8601
+])
+def test_parse_datetime(value):
+    dt = parse_datetime(value)
+    assert isinstance(dt, datetime)
+    assert dt.utcoffset().total_seconds() == 0
+    assert dt.timetuple()[:6] == (2000, 10, 10, 6, 12, 50)
+
+
 @pytest.mark.parametrize(["query", "params", "expected"], [
     ("key1=val1;key2=val21,val22;key3=val3;key4", {},
      {"key1": ["val1"], "key2": ["val21", "val22"], "key3": ["val3"], "key4": []}),
@@ -2287,3 +2322,30 @@ def test_create_metalink():
         )
         assert req_mock.calls[0].request.url == tmp_href4
         assert req_mock.calls[1].request.url == tmp_href5
+
+
+def test_load_file_local_memoized_copy():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", encoding="utf-8") as tmp_file:
+        tmp_file.write("key: [1, 2]\n")
+        tmp_file.flush()
+        data = load_file(tmp_file.name)
+        assert data == {"key": [1, 2]}
+        data["key"].append(3)
+        assert load_file(tmp_file.name) == {"key": [1, 2]}, "cached contents should not be modified by callers"
+
+        tmp_file.write("other: value\n")
+        tmp_file.flush()
+        assert load_file(tmp_file.name) == {"key": [1, 2], "other": "value"}, "modified file should be parsed again"
+
+
+def test_transform_json_replace_values():
+    data = {"a": 1, "b": "x", "c": [1, "x"], "d": {"x": 1}, "e": None}
+    result = transform_json(data, replace_values={"x": "y", None: "null", 1: 2})
+    assert result is data, "transformation should be applied in-place"
+    assert result == {"a": 2, "b": "y", "c": [1, "x"], "d": {"x": 1}, "e": "null"}
+
+
+def test_transform_json_nested_list_items():
+    data = {"items": [{"old": 1, "value": 2}, "text"], "old": 3}
+    result = transform_json(data, rename={"old": "new"}, replace_func={"value": lambda v: v * 10})
+    assert result == {"items": [{"new": 1, "value": 20}, "text"], "new": 3}
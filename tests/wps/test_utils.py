@@ -86,6 +86,12 @@ def test_set_wps_language():
     set_wps_language(wps, "en, fr;q=0.5, fr-CA;q=0.1")
     assert wps.language == "fr"
 
+    # single language tag, exact match (case-insensitive) or fallback to lookup of less specific language
+    set_wps_language(wps, "fr-ca")
+    assert wps.language == AcceptLanguage.FR_CA
+    set_wps_language(wps, "fr-CH")
+    assert wps.language == "fr"
+
 
 def test_get_wps_client_headers_preserved():
     """
@@ -122,6 +128,23 @@ def test_get_wps_client_headers_preserved():
     assert wps.url == test_wps_url
 
 
+def test_get_wps_client_headers_cache_key_order():
+    """
+    Validate that headers provided in different order resolve to the same cached WPS client arguments.
+    """
+    test_wps_url = "http://dont-care.com/wps"
+    test_headers = {"Authorization": "Bearer: FAKE", "Accept-Language": AcceptLanguage.FR_CA}  # nosec
+    test_headers_reversed = dict(reversed(list(test_headers.items())))
+
+    with mock.patch("weaver.wps.utils._get_wps_client_cached") as mocked_client:
+        get_wps_client(test_wps_url, headers=test_headers)
+        get_wps_client(test_wps_url, headers=test_headers_reversed)
+
+    call_args = [call.args for call in mocked_client.call_args_list]
+    assert len(call_args) == 2
+    assert str(call_args[0]) == str(call_args[1]), "Cache key generated from arguments should be identical"
+
+
 def test_get_wps_output_context_validation():
     bad_cases = [
         "test/////test",
@@ -134,7 +157,8 @@ def test_get_wps_output_context_validation():
         "/test/",
         "./test",
         "../test",
-        "/"
+        "/",
+        f"{'test' * 16}!",  # must not hang from regex backtracking
     ]
     good_cases = [
         ("test", "test"),
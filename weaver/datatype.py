@@ -14,7 +14,7 @@ import warnings
 from datetime import datetime, timedelta
 from decimal import ConversionSyntax, Decimal
 from io import BytesIO
-from logging import ERROR, INFO, Logger, getLevelName, getLogger
+from logging import ERROR, INFO, Formatter, Logger, LogRecord, getLogger
 from secrets import compare_digest, token_hex
 from typing import TYPE_CHECKING
 from urllib.parse import urljoin, urlparse
@@ -23,7 +23,6 @@ import colander
 import pyramid.httpexceptions
 import requests.exceptions
 from cryptography.fernet import Fernet
-from dateutil.parser import parse as dt_parse
 from docker.auth import decode_auth  # pylint: disable=E0611
 from owslib.util import ServiceException as OWSServiceException
 from owslib.wps import Process as ProcessOWS, WPSException
@@ -33,6 +32,7 @@ from pywps.response.describe import DescribeResponse
 from werkzeug.wrappers import Request as WerkzeugRequest
 
 from weaver import xml_util
+from weaver.compat import cache
 from weaver.exceptions import ProcessInstanceError, ServiceParsingError
 from weaver.execute import ExecuteControlOption, ExecuteMode, ExecuteResponse, ExecuteTransmissionMode
 from weaver.formats import AcceptLanguage, ContentType, repr_json
@@ -40,7 +40,7 @@ from weaver.processes.constants import CWL_REQUIREMENT_APP_DOCKER, CWL_REQUIREME
 from weaver.processes.convert import get_field, json2oas_io, normalize_ordered_io, null, ows2json, wps2json_io
 from weaver.processes.types import ProcessType
 from weaver.quotation.status import QuoteStatus
-from weaver.status import JOB_STATUS_CATEGORIES, Status, StatusCategory, map_status
+from weaver.status import JOB_STATUS_CATEGORIES, JOB_STATUS_VALUES, Status, StatusCategory, map_status
 from weaver.store.base import StoreProcesses
 from weaver.utils import localize_datetime  # for backward compatibility of previously saved jobs not time-locale-aware
 from weaver.utils import (
@@ -54,16 +54,17 @@ from weaver.utils import (
     get_log_fmt,
     get_settings,
     now,
+    parse_datetime,
     request_extra
 )
-from weaver.visibility import Visibility
+from weaver.visibility import VISIBILITY_VALUES, Visibility
 from weaver.warning import NonBreakingExceptionWarning, UnsupportedOperationWarning
 from weaver.wps.utils import get_wps_client, get_wps_url
 from weaver.wps_restapi import swagger_definitions as sd
 from weaver.wps_restapi.utils import get_wps_restapi_base_url
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Tuple, Union
+    from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Tuple, Type, Union
     from typing_extensions import TypeAlias
 
     from owslib.wps import WebProcessingService
@@ -113,6 +114,13 @@ class DictBase(dict):
     Explicitly overridden ``getter``/``setter`` attributes are called instead of ``dict``-key ``get``/``set``-item
     to ensure corresponding checks and/or value adjustments are executed before applying it to the sub-``dict``.
     """
+    _qualified_name = None  # type: str
+
+    def __init_subclass__(cls, **kwargs):
+        # type: (**Any) -> None
+        super(DictBase, cls).__init_subclass__(**kwargs)
+        # resolve only once since it is employed for every log entry and error message of the instances
+        cls._qualified_name = fully_qualified_name(cls)
 
     def __setattr__(self, item, value):
         """
@@ -134,7 +142,7 @@ class DictBase(dict):
         elif item in self:
             return getattr(self, item, None)
         else:
-            raise AttributeError(f"Can't get attribute '{item}' in '{fully_qualified_name(self)}'.")
+            raise AttributeError(f"Can't get attribute '{item}' in '{self._qualified_name}'.")
 
     def __str__(self):
         # type: () -> str
@@ -142,7 +150,7 @@ class DictBase(dict):
 
     def __repr__(self):
         # type: () -> str
-        _type = fully_qualified_name(self)
+        _type = self._qualified_name
         _repr = dict.__repr__(self)
         return f"{_type} ({_repr})"
 
@@ -229,7 +237,7 @@ class Base(DictBase):
     @property
     def __name__(self):
         # type: () -> str
-        return fully_qualified_name(self)
+        return self._qualified_name
 
     @property
     def id(self):
@@ -300,8 +308,8 @@ class LocalizedDateTimeProperty(property):
 
     def __set__(self, instance, value):
         # type: (Any, Union[datetime, str]) -> None
-        if isinstance(str, datetime):
-            value = dt_parse(value)
+        if isinstance(value, str):
+            value = parse_datetime(value)
         if not isinstance(value, datetime):
             name = fully_qualified_name(instance)
             raise TypeError(f"Type 'datetime' is required for '{name}.{self.name}'")
@@ -622,14 +630,30 @@ class Job(Base):
 
     It always has ``id`` and ``task_id`` keys.
     """
+    _log_formatter = Formatter(get_log_fmt(), get_log_date_fmt())
+    _params_fields = (
+        "service",
+        "process",
+        "user_id",
+        "status_location",
+        "statistics",
+        "request",
+        "response",
+        "subscribers",
+        "accept_language",
+    )
 
     def __init__(self, *args, **kwargs):
         # type: (*Any, **Any) -> None
         super(Job, self).__init__(*args, **kwargs)
         if "task_id" not in self:
             raise TypeError(f"Parameter 'task_id' is required for '{self.__name__}' creation.")
-        if not isinstance(self.id, (str, uuid.UUID)):
+        if not self.get("id"):
+            self["id"] = uuid.uuid4()
+        elif not isinstance(self.get("id"), (str, uuid.UUID)):
             raise TypeError(f"Type 'str' or 'UUID' is required for '{self.__name__}.id'")
+        if not self.get("created"):
+            self.created = now()
 
     @staticmethod
     def _get_message(message, size_limit=None):
@@ -718,16 +742,15 @@ class Job(Base):
             } for error in errors])
         else:
             log_msg = [(level, self._get_log_msg(message, status=status, progress=progress, size_limit=size_limit))]
+        name = self.__name__
+        logs = self.logs
+        last_msg = logs[-1] if logs else None
         for lvl, msg in log_msg:
-            fmt_data = {
-                "asctime": now().strftime(get_log_date_fmt()),
-                "levelname": getLevelName(lvl),
-                "name": self.__name__,
-                "message": msg,
-            }
-            fmt_msg = get_log_fmt() % fmt_data
-            if len(self.logs) == 0 or self.logs[-1] != fmt_msg:
-                self.logs.append(fmt_msg)
+            record = LogRecord(name, lvl, "", 0, msg, None, None)
+            fmt_msg = self._log_formatter.format(record)
+            if fmt_msg != last_msg:
+                logs.append(fmt_msg)
+                last_msg = fmt_msg
                 if logger:
                     logger.log(lvl, msg)
 
@@ -737,10 +760,7 @@ class Job(Base):
         """
         Job UUID to retrieve the details from storage.
         """
-        job_id = self.get("id")
-        if not job_id:
-            job_id = uuid.uuid4()
-            self["id"] = job_id
+        job_id = dict.__getitem__(self, "id")
         if isinstance(job_id, str):
             return uuid.UUID(job_id)
         return job_id
@@ -808,7 +828,7 @@ class Job(Base):
         # type: (Optional[AnyServiceRef]) -> None
         if isinstance(service, Service):
             service = service.id
-        if not isinstance(service, str) or service is None:
+        if not isinstance(service, str):
             raise TypeError(f"Type 'str' is required for '{self.__name__}.service'")
         self["service"] = service
 
@@ -828,7 +848,7 @@ class Job(Base):
         # type: (Optional[AnyProcessRef]) -> None
         if isinstance(process, Process):
             process = process.id
-        if not isinstance(process, str) or process is None:
+        if not isinstance(process, str):
             raise TypeError(f"Type 'str' is required for '{self.__name__}.process'")
         self["process"] = process
 
@@ -879,14 +899,17 @@ class Job(Base):
     @user_id.setter
     def user_id(self, user_id):
         # type: (Optional[str]) -> None
-        if not isinstance(user_id, int) or user_id is None:
+        if not isinstance(user_id, int):
             raise TypeError(f"Type 'int' is required for '{self.__name__}.user_id'")
         self["user_id"] = user_id
 
     @property
     def status(self):
         # type: () -> Status
-        return Status.get(self.get("status"), Status.UNKNOWN)
+        status = self.get("status")
+        if status in JOB_STATUS_VALUES:  # already normalized value, avoid lookup by name/value variations
+            return status
+        return Status.get(status, Status.UNKNOWN)
 
     @status.setter
     def status(self, status):
@@ -894,7 +917,7 @@ class Job(Base):
         value = Status.get(status)
         if value == Status.ACCEPTED and self.status == Status.RUNNING:
             LOGGER.debug(traceback.extract_stack())
-        if value not in Status:
+        if value not in JOB_STATUS_VALUES:
             statuses = list(Status.values())
             name = self.__name__
             raise ValueError(f"Status '{status}' is not valid for '{name}.status', must be one of {statuses!s}'")
@@ -922,7 +945,7 @@ class Job(Base):
     @status_location.setter
     def status_location(self, location_url):
         # type: (Optional[str]) -> None
-        if not isinstance(location_url, str) or location_url is None:
+        if not isinstance(location_url, str):
             raise TypeError(f"Type 'str' is required for '{self.__name__}.status_location'")
         self["status_location"] = location_url
 
@@ -1074,7 +1097,9 @@ class Job(Base):
         duration = self.duration
         if duration is None:
             return "00:00:00"
-        return str(duration).split(".", 1)[0].zfill(8)  # "HH:MM:SS"
+        hours, seconds = divmod(int(duration.total_seconds()), 3600)
+        minutes, seconds = divmod(seconds, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     @property
     def progress(self):
@@ -1171,7 +1196,10 @@ class Job(Base):
         """
         Job visibility access from execution.
         """
-        return Visibility.get(self.get("access"), Visibility.PRIVATE)
+        access = self.get("access")
+        if access in VISIBILITY_VALUES:
+            return access
+        return Visibility.get(access, Visibility.PRIVATE)
 
     @access.setter
     def access(self, visibility):
@@ -1180,7 +1208,7 @@ class Job(Base):
         Job visibility access from execution.
         """
         vis = Visibility.get(visibility)
-        if visibility not in Visibility.values():
+        if visibility not in VISIBILITY_VALUES:
             raise ValueError(f"Invalid 'visibility' value '{visibility!s}' specified for '{self.__name__}.access'")
         self["access"] = vis
 
@@ -1378,18 +1406,16 @@ class Job(Base):
 
     def params(self):
         # type: () -> AnyParams
-        return {
+        # fields without getter normalization are copied directly from the underlying dictionary
+        params = {field: self.get(field) for field in self._params_fields}
+        params.update({
             "id": self.id,
             "task_id": self.task_id,
             "wps_id": self.wps_id,
-            "service": self.service,
-            "process": self.process,
             "inputs": self.inputs,
             "outputs": self.outputs,
-            "user_id": self.user_id,
             "status": self.status,
             "status_message": self.status_message,
-            "status_location": self.status_location,
             "execution_response": self.execution_response,
             "execution_mode": self.execution_mode,
             "is_workflow": self.is_workflow,
@@ -1399,17 +1425,13 @@ class Job(Base):
             "updated": self.updated,
             "progress": self.progress,
             "results": self.results,
-            "statistics": self.statistics,
             "exceptions": self.exceptions,
             "logs": self.logs,
             "tags": self.tags,
             "access": self.access,
             "context": self.context,
-            "request": self.request,
-            "response": self.response,
-            "subscribers": self.subscribers,
-            "accept_language": self.accept_language,
-        }
+        })
+        return params
 
 
 class AuthenticationTypes(enum.Enum):
@@ -1867,6 +1889,28 @@ class VaultFile(Authentication):
         }
 
 
+@cache
+def get_wps_process_mapping():
+    # type: () -> Dict[str, Type[ProcessWPS]]
+    """
+    Mapping of :class:`Process` types to their corresponding :mod:`pywps` implementation.
+
+    The mapping is resolved only once since its classes must be imported at runtime to avoid circular imports.
+    """
+    from weaver.processes.wps_default import HelloWPS
+    from weaver.processes.wps_package import WpsPackage
+    from weaver.processes.wps_testing import WpsTestProcess
+
+    return {
+        HelloWPS.identifier: HelloWPS,
+        ProcessType.TEST: WpsTestProcess,
+        ProcessType.APPLICATION: WpsPackage,    # single CWL package
+        ProcessType.BUILTIN: WpsPackage,        # local scripts
+        ProcessType.WPS_REMOTE: WpsPackage,     # remote WPS
+        ProcessType.WORKFLOW: WpsPackage,       # chaining of CWL packages
+    }
+
+
 class Process(Base):
     # pylint: disable=C0103,invalid-name
     """
@@ -2224,28 +2268,35 @@ class Process(Base):
 
     # encode(->)/decode(<-) characters that cannot be in a key during save to db
     _character_codes = [("$", "\uFF04"), (".", "\uFF0E")]
+    _character_tables = {
+        (0, 1): str.maketrans(dict(_character_codes)),
+        (1, 0): str.maketrans({c_t: c_f for c_f, c_t in _character_codes}),
+    }
 
     @staticmethod
     def _recursive_replace(pkg, index_from, index_to):
         # type: (JSON, int, int) -> JSON
+        """
+        Generates a copy of the nested definition with keys replaced according to the character codes direction.
+
+        Nested containers are walked iteratively to avoid recursion overhead on deeply nested packages.
+        The original definition is left untouched.
+        """
+        table = Process._character_tables[(index_from, index_to)]
         new = {}
-        for k in pkg:
-            # find modified key with replace matches
-            c_k = k
-            for c in Process._character_codes:
-                c_f = c[index_from]
-                c_t = c[index_to]
-                if c_f in k:
-                    c_k = k.replace(c_f, c_t)
-            # process recursive sub-items
-            if isinstance(pkg[k], dict):
-                pkg[k] = Process._recursive_replace(pkg[k], index_from, index_to)
-            if isinstance(pkg[k], list):
-                for i, pkg_i in enumerate(pkg[k]):
-                    if isinstance(pkg_i, dict):
-                        pkg[k][i] = Process._recursive_replace(pkg[k][i], index_from, index_to)
-            # apply new key to obtained sub-items with replaced keys as needed
-            new[c_k] = pkg[k]   # note: cannot use pop when using pkg keys iterator (python 3)
+        stack = [(pkg, new)]
+        while stack:
+            src, dst = stack.pop()
+            is_dict = isinstance(src, dict)
+            for key, val in (src.items() if is_dict else enumerate(src)):
+                if isinstance(val, (dict, list)):
+                    sub = {} if isinstance(val, dict) else []
+                    stack.append((val, sub))
+                    val = sub
+                if is_dict:
+                    dst[key.translate(table)] = val
+                else:
+                    dst.append(val)
         return new
 
     @staticmethod
@@ -2270,7 +2321,7 @@ class Process(Base):
     @estimator.setter
     def estimator(self, estimator):
         # type: (Optional[JSON]) -> None
-        if not isinstance(estimator, dict) or estimator is None:
+        if not isinstance(estimator, dict):
             raise ValueError(
                 f"Estimator value '{estimator}' is not valid for '{self.__name__}.estimator'. Must be JSON."
             )
@@ -2279,13 +2330,16 @@ class Process(Base):
     @property
     def visibility(self):
         # type: () -> Visibility
-        return Visibility.get(self.get("visibility"), Visibility.PUBLIC)
+        visibility = self.get("visibility")
+        if visibility in VISIBILITY_VALUES:
+            return visibility
+        return Visibility.get(visibility, Visibility.PUBLIC)
 
     @visibility.setter
     def visibility(self, visibility):
         # type: (AnyVisibility) -> None
         vis = Visibility.get(visibility)
-        if vis not in Visibility:
+        if vis not in VISIBILITY_VALUES:
             values = list(Visibility.values())
             raise ValueError(
                 f"Status '{visibility}' is not valid for '{self.__name__}.visibility, must be one of {values!s}'"
@@ -2670,20 +2724,7 @@ class Process(Base):
         """
         Converts this :class:`Process` to a corresponding format understood by :mod:`pywps`.
         """
-        # import here to avoid circular import errors
-        from weaver.processes.wps_default import HelloWPS
-        from weaver.processes.wps_package import WpsPackage
-        from weaver.processes.wps_testing import WpsTestProcess
-
-        process_map = {
-            HelloWPS.identifier: HelloWPS,
-            ProcessType.TEST: WpsTestProcess,
-            ProcessType.APPLICATION: WpsPackage,    # single CWL package
-            ProcessType.BUILTIN: WpsPackage,        # local scripts
-            ProcessType.WPS_REMOTE: WpsPackage,     # remote WPS
-            ProcessType.WORKFLOW: WpsPackage,       # chaining of CWL packages
-        }
-
+        process_map = get_wps_process_mapping()
         process_key = self.type
         if self.type == ProcessType.WPS_LOCAL:
             process_key = self.identifier
@@ -2693,6 +2734,8 @@ class Process(Base):
 
 
 class PriceMixin(Base, abc.ABC):
+    _currency_code_match = re.compile(r"[A-Z]{3}").fullmatch
+
     @property
     def amount(self):
         # type: () -> Decimal
@@ -2723,7 +2766,7 @@ class PriceMixin(Base, abc.ABC):
     @currency.setter
     def currency(self, currency):
         # type: (str) -> None
-        if not isinstance(currency, str) or not re.match(r"^[A-Z]{3}$", currency):
+        if not isinstance(currency, str) or not self._currency_code_match(currency):
             raise ValueError(f"Field '{self.__name__}.currency' must be an ISO-4217 currency string code.")
         self["currency"] = currency
 
@@ -3073,35 +3116,40 @@ class Bill(PriceMixin, Base):
 
     It always has ``id``, ``user``, ``quote`` and ``job`` keys.
     """
+    # (name, type, description) of fields validated on creation
+    _required_fields = (
+        ("quote", str, "a string"),
+        ("job", str, "a string"),
+        ("user", str, "a string"),
+        ("price", float, "a float number"),
+        ("currency", str, "an ISO-4217 currency string code"),
+    )
+    _params_fields = (
+        "id",
+        "user",
+        "quote",
+        "job",
+        "created",
+        "title",
+        "description",
+    )
 
     def __init__(self, *args, **kwargs):
         super(Bill, self).__init__(*args, **kwargs)
-        if "quote" not in self:
-            raise TypeError("Field 'Bill.quote' is required")
-        if not isinstance(self.get("quote"), str):
-            raise ValueError("Field 'Bill.quote' must be a string.")
-        if "job" not in self:
-            raise TypeError("Field 'Bill.job' is required")
-        if not isinstance(self.get("job"), str):
-            raise ValueError("Field 'Bill.job' must be a string.")
-        if "user" not in self:
-            raise TypeError("Field 'Bill.user' is required")
-        if not isinstance(self.get("user"), str):
-            raise ValueError("Field 'Bill.user' must be a string.")
-        if "price" not in self:
-            raise TypeError("Field 'Bill.price' is required")
-        if not isinstance(self.get("price"), float):
-            raise ValueError("Field 'Bill.price' must be a float number.")
-        if "currency" not in self:
-            raise TypeError("Field 'Bill.currency' is required")
-        if not isinstance(self.get("currency"), str) or len(self.get("currency")) != 3:
+        for field, field_type, field_desc in self._required_fields:
+            if field not in self:
+                raise TypeError(f"Field 'Bill.{field}' is required")
+            if not isinstance(dict.__getitem__(self, field), field_type):
+                raise ValueError(f"Field 'Bill.{field}' must be {field_desc}.")
+        if not self._currency_code_match(dict.__getitem__(self, "currency")):
             raise ValueError("Field 'Bill.currency' must be an ISO-4217 currency string code.")
-        if "created" not in self:
-            self["created"] = now()
-        try:
-            self["created"] = dt_parse(str(self.get("created"))).isoformat()
-        except ValueError:
-            raise ValueError("Field 'Bill.created' must be an ISO-8601 datetime string.")
+        created = self.get("created") or now()
+        if not isinstance(created, datetime):
+            try:
+                created = parse_datetime(str(created))
+            except ValueError:
+                raise ValueError("Field 'Bill.created' must be an ISO-8601 datetime string.")
+        self["created"] = created.isoformat()
         if "id" not in self:
             self["id"] = uuid.uuid4()
 
@@ -3156,16 +3204,10 @@ class Bill(PriceMixin, Base):
 
     def params(self):
         # type: () -> AnyParams
-        return {
-            "id": self.id,
-            "user": self.user,
-            "quote": self.quote,
-            "job": self.job,
-            "price": self.price,
-            "created": self.created,
-            "title": self.title,
-            "description": self.description,
-        }
+        # fields without getter normalization are copied directly from the underlying dictionary
+        params = {field: self.get(field) for field in self._params_fields}
+        params["price"] = self.price
+        return params
 
     def json(self):
         # type: () -> JSON
@@ -2,18 +2,17 @@ import base64
 import datetime
 import json
 import logging
-import os
 import re
-import socket
+from functools import lru_cache
 from typing import TYPE_CHECKING, overload
-from urllib.error import HTTPError
-from urllib.request import urlopen
 
+import requests
 import yaml
 from json2xml.json2xml import Json2xml
 from pyramid.httpexceptions import HTTPNotFound, HTTPOk
 from pyramid_storage.extensions import resolve_extensions
 from pywps.inout.formats import FORMATS, Format
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError
 
 from weaver.base import Constants, classproperty
@@ -513,6 +512,24 @@ IANA_KNOWN_MEDIA_TYPES = {
     ContentType.TEXT_RICHTEXT,
     ContentType.VIDEO_MPEG,
 }
+# Officially registered entries in IANA Media-Type namespace registry that are resolved statically to avoid
+# validating their existence with HTTP requests. Any other Media-Type is still validated against the registry.
+IANA_REGISTERED_MEDIA_TYPES = frozenset(IANA_KNOWN_MEDIA_TYPES | {
+    ContentType.APP_CWL,
+    ContentType.APP_FORM,
+    ContentType.APP_GEOJSON,
+    ContentType.APP_GZIP,
+    ContentType.APP_JSON,
+    ContentType.APP_OCTET_STREAM,
+    ContentType.APP_PDF,
+    ContentType.APP_XML,
+    ContentType.APP_ZIP,
+    ContentType.IMAGE_PNG,
+    ContentType.IMAGE_TIFF,
+    ContentType.MULTI_PART_FORM,
+    ContentType.TEXT_HTML,
+    ContentType.TEXT_XML,
+})
 # types to enforce to IANA in case another equivalent is known in other following mappings
 # duplicates in other mappings are left defined in case they are employed by a user to ensure their detection
 # but prefer the IANA resolution with is the primary reference for Media-Types
@@ -577,6 +594,12 @@ FORMAT_NAMESPACE_PREFIXES = [
     f"{_ns}:" for _ns in FORMAT_NAMESPACE_DEFINITIONS
 ] + list(FORMAT_NAMESPACE_DEFINITIONS.values())
 FORMAT_NAMESPACES = frozenset(FORMAT_NAMESPACE_DEFINITIONS)
+_FORMAT_NAMESPACE_KEY_PREFIXES = tuple(f"{_ns}:" for _ns in FORMAT_NAMESPACE_DEFINITIONS)
+# reverse lookup of namespace formats to their first (preferred) Media-Type, by order of namespace priority
+_FORMAT_NAMESPACE_MEDIA_TYPES = {}  # type: Dict[str, str]
+for _map in (EDAM_MAPPING, OGC_MAPPING, OPENGIS_MAPPING):
+    for _ctype, _fmt in _map.items():
+        _FORMAT_NAMESPACE_MEDIA_TYPES.setdefault(_fmt, _ctype)
 
 
 def get_allowed_extensions():
@@ -648,8 +671,9 @@ def get_extension(media_type, dot=True):
     ctype = clean_media_type_format(media_type, strip_parameters=True)
     if not ctype:
         return ""
-    ext_default = f".{ctype.split('/')[-1].replace('x-', '')}"
-    ext = _CONTENT_TYPE_EXTENSION_MAPPING.get(ctype, ext_default)
+    ext = _CONTENT_TYPE_EXTENSION_MAPPING.get(ctype)
+    if ext is None:
+        ext = f".{ctype.rpartition('/')[2].replace('x-', '')}"
     return _handle_dot(ext)
 
 
@@ -695,7 +719,28 @@ def add_content_type_charset(content_type, charset):
     return content_type
 
 
-def get_cwl_file_format(media_type, make_reference=False, must_exist=True, allow_synonym=True):  # pylint: disable=R1260
+# successful resolutions of 'get_cwl_file_format', bounded since media-types could be provided by user definitions
+_CWL_FILE_FORMAT_CACHE = {}  # type: Dict[Tuple[str, bool, bool, bool], Union[Tuple[JSON, str], str]]
+_CWL_FILE_FORMAT_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def get_iana_session():
+    # type: () -> requests.Session
+    """
+    Obtains a shared session with pooled connections to validate :term:`IANA` Media-Types references.
+
+    Reusing the same session keeps connections alive across lookups of different Media-Types, avoiding a new
+    TCP and TLS handshake for each of them.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_cwl_file_format(media_type, make_reference=False, must_exist=True, allow_synonym=True):
     # type: (str, bool, bool, bool) -> Union[Tuple[Optional[JSON], Optional[str]], Optional[str]]
     """
     Obtains the extended schema reference from the media-type identifier.
@@ -730,6 +775,12 @@ def get_cwl_file_format(media_type, make_reference=False, must_exist=True, allow
         ``must_exist=False`` before providing it to the `CWL` I/O definition. Setting ``must_exist=False`` should be
         used only for literal string comparison or pre-processing steps to evaluate formats.
 
+    Note:
+        Successful resolutions are memoized for each combination of arguments since they are requested repeatedly for
+        the same few media-types while converting :term:`I/O` definitions, and might otherwise require remote
+        validation. Unresolved media-types are not memoized, to allow a later remote validation to succeed in case
+        the previous one failed because of a temporary connection issue.
+
     :param media_type: Some reference, namespace'd or literal (possibly extended) media-type string.
     :param make_reference: Construct the full URL reference to the resolved media-type. Otherwise, return tuple details.
     :param must_exist:
@@ -742,9 +793,27 @@ def get_cwl_file_format(media_type, make_reference=False, must_exist=True, allow
         Requires ``must_exist=True``, otherwise the non-official media-type is employed directly as result.
     :returns: Resolved media-type format for `CWL` usage, accordingly to specified arguments (see description details).
     """
+    cache_key = (media_type, make_reference, must_exist, allow_synonym)
+    found = _CWL_FILE_FORMAT_CACHE.get(cache_key)
+    if found is not None:
+        return found
+    found = _resolve_cwl_file_format(media_type, make_reference, must_exist, allow_synonym)
+    if found not in [None, (None, None)] and len(_CWL_FILE_FORMAT_CACHE) < _CWL_FILE_FORMAT_CACHE_SIZE:
+        _CWL_FILE_FORMAT_CACHE[cache_key] = found
+    return found
+
+
+def _resolve_cwl_file_format(media_type, make_reference, must_exist, allow_synonym):  # pylint: disable=R1260
+    # type: (str, bool, bool, bool) -> Union[Tuple[Optional[JSON], Optional[str]], Optional[str]]
+    """
+    Resolves the media-type format without memoization.
+
+    .. seealso::
+        :func:`get_cwl_file_format` for details about parameters and resolution procedure.
+    """
     def _make_if_ref(_map, _key, _fmt):
         # type: (Dict[str, str], str, str) -> Union[Tuple[Optional[JSON], Optional[str]], Optional[str]]
-        return os.path.join(_map[_key], _fmt) if make_reference else (_map, f"{_key}:{_fmt}")
+        return f"{_map[_key]}{_fmt}" if make_reference else (_map, f"{_key}:{_fmt}")
 
     def _search_explicit_mappings(_media_type):
         # type: (str) -> Union[Tuple[Optional[JSON], Optional[str]], Optional[str]]
@@ -767,7 +836,7 @@ def get_cwl_file_format(media_type, make_reference=False, must_exist=True, allow
 
         _media_type = clean_media_type_format(_media_type, strip_parameters=True)
         _media_type_url = f"{IANA_NAMESPACE_DEFINITION[IANA_NAMESPACE]}{_media_type}"
-        if _media_type in IANA_KNOWN_MEDIA_TYPES:  # avoid HTTP NotFound
+        if _media_type in IANA_REGISTERED_MEDIA_TYPES:  # avoid HTTP requests and NotFound of known types
             # prefer real reference if available
             _found = _search_explicit_mappings(_media_type)
             if _found is not None:
@@ -782,17 +851,17 @@ def get_cwl_file_format(media_type, make_reference=False, must_exist=True, allow
                 return _make_if_ref(IANA_NAMESPACE_DEFINITION, IANA_NAMESPACE, _media_type)
         except ConnectionError as exc:
             LOGGER.debug("Format request [%s] connection error: [%s]", _media_type_url, exc)
-        try:
-            for _ in range(retries):
-                try:
-                    with urlopen(_media_type_url, timeout=2) as resp:  # nosec: B310  # IANA scheme guaranteed HTTP
-                        if resp.code == HTTPOk.code:
-                            return _make_if_ref(IANA_NAMESPACE_DEFINITION, IANA_NAMESPACE, _media_type)
-                except socket.timeout:
-                    continue
-                break
-        except HTTPError:
-            pass
+        session = get_iana_session()
+        for _ in range(retries):
+            try:
+                resp = session.head(_media_type_url, timeout=2, allow_redirects=True)
+                if resp.status_code == HTTPOk.code:
+                    return _make_if_ref(IANA_NAMESPACE_DEFINITION, IANA_NAMESPACE, _media_type)
+            except requests.Timeout:
+                continue
+            except requests.RequestException as exc:
+                LOGGER.debug("Format request [%s] fallback error: [%s]", _media_type_url, exc)
+            break
         return None
 
     if not media_type:
@@ -895,20 +964,17 @@ def clean_media_type_format(media_type, suffix_subtype=False, strip_parameters=F
         if v in media_type:
             media_type = media_type.replace(v, "")
             break
-    for v in FORMAT_NAMESPACE_DEFINITIONS:
-        if media_type.startswith(f"{v}:"):
-            media_type = media_type.replace(f"{v}:", "")
-            break
-    search = True
-    for _map in [EDAM_MAPPING, OGC_MAPPING, OPENGIS_MAPPING]:
-        if not search:
+    for v in _FORMAT_NAMESPACE_KEY_PREFIXES:
+        if media_type.startswith(v):
+            media_type = media_type.replace(v, "")
             break
-        for v in _map.values():
-            if v.endswith(media_type):
-                media_type = [k for k in _map if v.endswith(_map[k])][0]
-                search = False
+    ctype = _FORMAT_NAMESPACE_MEDIA_TYPES.get(media_type)
+    if ctype is None:  # partial format name
+        for fmt, fmt_ctype in _FORMAT_NAMESPACE_MEDIA_TYPES.items():
+            if fmt.endswith(media_type):
+                ctype = fmt_ctype
                 break
-    return media_type
+    return ctype or media_type
 
 
 def guess_target_format(request, default=ContentType.APP_JSON):
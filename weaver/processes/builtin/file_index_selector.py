@@ -13,9 +13,12 @@ if TYPE_CHECKING:
     from typing import List
 
 CUR_DIR = os.path.abspath(os.path.dirname(__file__))
-sys.path.insert(0, CUR_DIR)
+if CUR_DIR not in sys.path:
+    sys.path.insert(0, CUR_DIR)
 # root to allow 'from weaver import <...>'
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(CUR_DIR))))
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(CUR_DIR)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
 
 # place weaver specific imports after sys path fixing to ensure they are found from external call
 # pylint: disable=C0413,wrong-import-order
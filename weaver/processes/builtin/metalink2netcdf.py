@@ -8,11 +8,15 @@ import logging
 import os
 import sys
 from tempfile import TemporaryDirectory
+from urllib.parse import urlparse
 
 CUR_DIR = os.path.abspath(os.path.dirname(__file__))
-sys.path.insert(0, CUR_DIR)
+if CUR_DIR not in sys.path:
+    sys.path.insert(0, CUR_DIR)
 # root to allow 'from weaver import <...>'
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(CUR_DIR))))
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(CUR_DIR)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
 
 # place weaver specific imports after sys path fixing to ensure they are found from external call
 # pylint: disable=C0413,wrong-import-order
@@ -25,7 +29,8 @@ PACKAGE_NAME, PACKAGE_BASE, PACKAGE_MODULE = get_package_details(__file__)
 
 # setup logger since it is not run from the main 'weaver' app
 LOGGER = logging.getLogger(PACKAGE_MODULE)
-LOGGER.addHandler(logging.StreamHandler(sys.stdout))
+if not LOGGER.handlers:  # avoid duplicate log lines if the module is imported again
+    LOGGER.addHandler(logging.StreamHandler(sys.stdout))
 LOGGER.setLevel(logging.INFO)
 
 # process details
@@ -34,40 +39,101 @@ __title__ = "Metalink to NetCDF"
 __abstract__ = __doc__  # NOTE: '__doc__' is fetched directly, this is mostly to be informative
 
 
+def find_metalink_file_url(metalink_path, index):
+    # type: (str, int) -> str
+    """
+    Finds the file URL at the given index of the Metalink file.
+
+    The Metalink is parsed incrementally and parsing stops as soon as the requested ``file`` entry is reached.
+    Preceding entries are discarded once parsed to avoid loading the complete document in memory.
+
+    :param metalink_path: Local path of the Metalink file.
+    :param index: Index of the file entry to retrieve. First element's index is 1.
+    :returns: Resolved file URL, or an empty string if it could not be found.
+    """
+    root = None
+    ns = ""
+    meta4 = os.path.splitext(metalink_path)[-1] == ".meta4"
+    count = 0
+    for event, elem in xml_util.iterparse(metalink_path, events=("start", "end")):
+        if root is None:  # first 'start' event is the root element
+            root = elem
+            meta_ns = root.nsmap.get(None)  # metalink URN namespace
+            ns = f"{{{meta_ns}}}" if meta_ns else ""
+            if root.tag != f"{ns}metalink":
+                return ""
+            meta4 = meta4 or root.get("version") == "4.0"
+            continue
+        if event != "end" or elem.tag != f"{ns}file":
+            continue
+        parent = elem.getparent()
+        if meta4:
+            # v4: '/metalink/file[<index>]/metaurl'
+            if parent is not root:
+                continue
+        elif parent.tag != f"{ns}files" or parent.getparent() is not root:
+            # v3: '/metalink/files/file[<index>]/resources[1]/url'
+            continue
+        count += 1
+        if count == index:
+            url = elem.find(f"{ns}metaurl" if meta4 else f"{ns}resources/{ns}url")
+            return "".join(url.itertext()) if url is not None else ""
+        elem.clear()
+        while elem.getprevious() is not None:
+            del parent[0]
+    return ""
+
+
+def fetch_metalink(metalink_reference, tmp_dir):
+    # type: (str, str) -> str
+    """
+    Fetches the Metalink reference into the temporary directory.
+
+    :returns: Local path of the fetched Metalink file.
+    """
+    LOGGER.info("Fetching Metalink file: [%s]", metalink_reference)
+    return fetch_file(metalink_reference, tmp_dir, timeout=10, retry=3)
+
+
+def fetch_netcdf(nc_file_url, output_dir):
+    # type: (str, str) -> str
+    """
+    Validates and fetches the NetCDF reference resolved from the Metalink into the output directory.
+
+    :returns: Local path of the fetched NetCDF file.
+    """
+    if not is_netcdf_url(nc_file_url):
+        raise ValueError(f"Resolved file URL [{nc_file_url}] is not a valid NetCDF reference.")
+    LOGGER.info("Validating NetCDF reference: [%s]", nc_file_url)
+    validate_reference(nc_file_url, is_file=True)
+    return fetch_file(nc_file_url, output_dir)
+
+
 def m2n(metalink_reference, index, output_dir):
     # type: (str, int, str) -> None
     LOGGER.info(
-        "Got arguments: metalink_reference=%s index=%s output_dir=%s", metalink_reference, index, output_dir
+        "Process '%s' execution starting with arguments: metalink_reference=%s index=%s output_dir=%s",
+        PACKAGE_NAME, metalink_reference, index, output_dir,
     )
-    LOGGER.info("Process '%s' execution starting...", PACKAGE_NAME)
-    LOGGER.info("Process '%s' output directory: [%s].", PACKAGE_NAME, output_dir)
     try:
         if not os.path.isdir(output_dir):
             raise ValueError(f"Output dir [{output_dir}] does not exist.")
+        if not isinstance(index, int) or isinstance(index, bool):
+            raise ValueError(f"Index [{index}] must be an integer.")
         LOGGER.info("Validating Metalink file: [%s]", metalink_reference)
         validate_reference(metalink_reference, is_file=True)
-        with TemporaryDirectory(prefix=f"wps_process_{PACKAGE_NAME}_") as tmp_dir:
-            LOGGER.info("Fetching Metalink file: [%s]", metalink_reference)
-            metalink_path = fetch_file(metalink_reference, tmp_dir, timeout=10, retry=3)
-            LOGGER.info("Reading Metalink file: [%s]", metalink_path)
-            xml_data = xml_util.parse(metalink_path)
-            LOGGER.debug("Parsing Metalink file references.")
-            meta_ns = xml_data.getroot().nsmap[None]  # metalink URN namespace, pass explicitly otherwise xpath fails
-            meta_version = xml_data.xpath("/m:metalink[1]", namespaces={"m": meta_ns})
-            if (
-                (meta_version and meta_version[0].get("version") == "4.0") or
-                os.path.splitext(metalink_path)[-1] == ".meta4"
-            ):
-                ns_xpath = f"/m:metalink/m:file[{index}]/m:metaurl"
-            else:
-                ns_xpath = f"/m:metalink/m:files/m:file[{index}]/m:resources[1]/m:url"
-            nc_file_url = str(xml_data.xpath(f"string({ns_xpath})", namespaces={"m": meta_ns}))
-            if not is_netcdf_url(nc_file_url):
-                raise ValueError(f"Resolved file URL [{nc_file_url}] is not a valid NetCDF reference.")
-            LOGGER.info("Validating NetCDF reference: [%s]", nc_file_url)
-            validate_reference(nc_file_url, is_file=True)
-            LOGGER.info("Fetching NetCDF reference [%s] from Metalink file [%s]", nc_file_url, metalink_reference)
-            fetch_file(nc_file_url, output_dir)
+        metalink_url = urlparse(metalink_reference)
+        if metalink_url.scheme in ["", "file"] and os.path.isfile(metalink_url.path):
+            # local file (e.g.: intermediate workflow step output) can be read in place without a temporary copy
+            LOGGER.info("Reading Metalink file: [%s]", metalink_url.path)
+            nc_file_url = find_metalink_file_url(metalink_url.path, index)
+        else:
+            with TemporaryDirectory(prefix=f"wps_process_{PACKAGE_NAME}_") as tmp_dir:
+                metalink_path = fetch_metalink(metalink_reference, tmp_dir)
+                LOGGER.info("Reading Metalink file: [%s]", metalink_path)
+                nc_file_url = find_metalink_file_url(metalink_path, index)
+        LOGGER.info("Fetching NetCDF reference [%s] from Metalink file [%s]", nc_file_url, metalink_reference)
+        fetch_netcdf(nc_file_url, output_dir)
     except Exception as exc:
         # log only debug for tracking, re-raise and actual error wil be logged by top process monitor
         LOGGER.error("Process '%s' raised an unhandled exception: [%s]", PACKAGE_NAME, exc)
@@ -217,6 +217,8 @@ PACKAGE_ARRAY_BASE = "array"
 PACKAGE_ARRAY_MAX_SIZE = sys.maxsize  # pywps doesn't allow None, so use max size  # FIXME: unbounded (weaver #165)
 PACKAGE_ARRAY_ITEMS = frozenset(PACKAGE_BASIC_TYPES | PACKAGE_CUSTOM_TYPES | PACKAGE_COMPLEX_TYPES)
 PACKAGE_ARRAY_TYPES = frozenset([f"{item}[]" for item in PACKAGE_ARRAY_ITEMS])
+# mapping of shorthand array notation '<type>[]' to the corresponding '<type>' of items
+PACKAGE_ARRAY_TYPE_ITEMS = MappingProxyType({f"{item}[]": item for item in PACKAGE_ARRAY_ITEMS})
 # string values the lowest 'type' field can have by itself (as simple mapping {type: <type-string>})
 PACKAGE_TYPE_NULLABLE = frozenset(PACKAGE_BASIC_TYPES | PACKAGE_CUSTOM_TYPES | PACKAGE_COMPLEX_TYPES)
 # shortcut notations that can be employed to convert basic types into corresponding array or nullable variants
@@ -7,7 +7,6 @@ import json
 import logging
 import os
 from collections import OrderedDict
-from collections.abc import Hashable
 from copy import deepcopy
 from dataclasses import dataclass
 from tempfile import TemporaryDirectory
@@ -58,7 +57,7 @@ from weaver.processes.constants import (
     PACKAGE_ARRAY_BASE,
     PACKAGE_ARRAY_ITEMS,
     PACKAGE_ARRAY_MAX_SIZE,
-    PACKAGE_ARRAY_TYPES,
+    PACKAGE_ARRAY_TYPE_ITEMS,
     PACKAGE_BASIC_TYPES,
     PACKAGE_COMPLEX_TYPES,
     PACKAGE_CUSTOM_TYPES,
@@ -243,12 +242,28 @@ WPS_FIELD_MAPPING = {
 #   - keys must match `WPS_FIELD_MAPPING` keys
 #   - fields are placed in order of relevance (prefer explicit format, then supported, and defaults as last resort)
 WPS_FIELD_FORMAT = ["formats", "supported_formats", "supported_values", "default"]
+# WPS fields combined between WPS and CWL I/O definitions, in order of evaluation (see 'merge_io_fields')
+WPS_FIELD_MERGE = (
+    "metadata",
+    *(field for field in WPS_FIELD_MAPPING if field != "metadata"),
+    "_default",
+    "data_format",
+)
 
 # default format if missing (minimal requirement of one)
 DEFAULT_FORMAT = Format(mime_type=ContentType.TEXT_PLAIN)
 DEFAULT_FORMAT_MISSING = "__DEFAULT_FORMAT_MISSING__"
 setattr(DEFAULT_FORMAT, DEFAULT_FORMAT_MISSING, True)
 
+# CWL literal type -> corresponding WPS literal data type, when they differ
+CWL_WPS_LITERAL_TYPE_MAPPING = {
+    "Any": "anyvalue",
+    "null": "novalue",
+    "int": "integer",
+    "long": "integer",
+    "double": "float",
+}
+
 INPUT_VALUE_TYPE_MAPPING = {
     "bool": bool,
     "boolean": bool,
@@ -1206,10 +1221,9 @@ def parse_cwl_array_type(io_info, strict=True):
         io_return.type = list(filter(lambda sub_type: sub_type != "null", io_info["type"]))[0]
 
     # array type conversion when defined as '{"type": "array", "items": "<type>"}'
-    # validate against 'Hashable' instead of 'dict' since 'OrderedDict'/'CommentedMap' can fail 'isinstance()'
+    # 'OrderedDict' and 'CommentedMap' (from 'ruamel.yaml' loaded by 'cwltool') are both 'dict' subclasses
     if (
-        not isinstance(io_return.type, str)
-        and not isinstance(io_return.type, Hashable)
+        isinstance(io_return.type, dict)
         and "items" in io_return.type
         and "type" in io_return.type
     ):
@@ -1230,15 +1244,16 @@ def parse_cwl_array_type(io_info, strict=True):
         LOGGER.debug("I/O [%s] parsed as 'array' with nested dict notation", io_info["name"])
         io_return.array = True
     # array type conversion when defined as string '<type>[]'
-    elif isinstance(io_return.type, str) and get_cwl_io_type_name(io_return.type) in PACKAGE_ARRAY_TYPES:
-        io_return.type = get_cwl_io_type_name(io_return.type[:-2])  # remove '[]'
+    elif isinstance(io_return.type, str) and get_cwl_io_type_name(io_return.type) in PACKAGE_ARRAY_TYPE_ITEMS:
+        io_return.type = PACKAGE_ARRAY_TYPE_ITEMS[get_cwl_io_type_name(io_return.type)]  # remove '[]'
         if io_return.type in PACKAGE_CUSTOM_TYPES:
             # parse 'enum[]' for array of allowed symbols, provide expected structure for sub-item parsing
             io_item = deepcopy(io_info)
             io_item["type"] = io_return.type  # override corrected type without '[]'
             _update_if_sub_enum(io_item)
-        if io_return.type not in PACKAGE_ARRAY_ITEMS:
-            raise PackageTypeError(f"Unsupported I/O 'array' definition: '{io_info!r}'.")
+            # item type resolved from the mapping is always supported, only the sub-enum parsing can modify it
+            if io_return.type not in PACKAGE_ARRAY_ITEMS:
+                raise PackageTypeError(f"Unsupported I/O 'array' definition: '{io_info!r}'.")
         LOGGER.debug("I/O [%s] parsed as 'array' with shorthand '[]' notation", io_info["name"])
         io_return.array = True
 
@@ -1609,14 +1624,7 @@ def cwl2wps_io(io_info, io_select):
 
     # literal types
     if io_def.enum or (isinstance(io_def.type, str) and io_def.type in PACKAGE_LITERAL_TYPES):
-        if io_def.type == "Any":
-            io_def.type = "anyvalue"
-        if io_def.type == "null":
-            io_def.type = "novalue"
-        if io_def.type in ["int", "integer", "long"]:
-            io_def.type = "integer"
-        if io_def.type in ["float", "double"]:
-            io_def.type = "float"
+        io_def.type = CWL_WPS_LITERAL_TYPE_MAPPING.get(io_def.type, io_def.type)
         # keywords commonly used by I/O
         kw = {
             "identifier": io_def.name,
@@ -3064,17 +3072,20 @@ def json2wps_io(io_info, io_select):  # pylint: disable=R1260
     # convert supported format objects
     formats = get_field(io_info, "supported_formats", search_variations=True, pop_found=True)
     if formats is not null:
+        wps_formats = []
         for fmt in formats:
             fmt["mime_type"] = get_field(fmt, "mime_type", search_variations=True, pop_found=True)
             fmt.pop("maximumMegabytes", None)
+            wps_fmt = json2wps_field(fmt, "supported_formats")
             # define the 'default' with 'data_format' to be used if explicitly specified from the payload
             if fmt.get("default", None) is True:
                 if get_field(io_info, "data_format") != null:  # if set by previous 'fmt'
                     raise PackageTypeError("Cannot have multiple 'default' formats simultaneously.")
                 # use 'data_format' instead of 'default' to avoid overwriting a potential 'default' value
                 # field 'data_format' is mapped as 'default' format
-                io_info["data_format"] = json2wps_field(fmt, "supported_formats")
-        io_info["supported_formats"] = [json2wps_field(fmt, "supported_formats") for fmt in formats]
+                io_info["data_format"] = wps_fmt
+            wps_formats.append(wps_fmt)
+        io_info["supported_formats"] = wps_formats
 
     # convert metadata objects
     metadata = get_field(io_info, "metadata", search_variations=True, pop_found=True)
@@ -3221,9 +3232,13 @@ def wps2json_io(io_wps, forced_fields=False):
     if io_wps_json["type"] == WPS_COMPLEX:
         # FIXME: should we store 'None' in db instead of empty string when missing "encoding", "schema", etc. ?
         if "formats" not in io_wps_json or not len(io_wps_json["formats"]):
-            io_wps_json["formats"] = [DEFAULT_FORMAT.json]
-        for io_format in io_wps_json["formats"]:
-            transform_json(io_format, rename=rename, replace_values=replace_values, replace_func=replace_func)
+            default_format = DEFAULT_FORMAT.json
+            transform_json(default_format, rename=rename, replace_values=replace_values, replace_func=replace_func)
+            io_wps_json["formats"] = [default_format]
+        else:
+            # formats were already renamed and converted by the nested list handling of the above transformation
+            for io_format in io_wps_json["formats"]:
+                transform_json(io_format, replace_values=replace_values)
 
         # set 'default' format if it matches perfectly, or if only mime-type matches, and it is the only available one
         # (this avoids 'encoding' possibly not matching due to CWL not providing this information)
@@ -3338,24 +3353,21 @@ def get_field(io_object,
     :param default: Alternative default value to return if no match could be found.
     :returns: Matched value (including search variations if enabled), or ``default``.
     """
-    if not (search_variations and only_variations):
-        if isinstance(io_object, dict):
-            value = io_object.get(field, null)
+    names = () if search_variations and only_variations else (field,)
+    if search_variations or extra_variations:
+        names = (*names, *(extra_variations or ()), *WPS_FIELD_MAPPING.get(field, ()))
+    if isinstance(io_object, dict):
+        for name in names:
+            value = io_object.get(name, null)
             if value is not null:
                 if pop_found:
-                    io_object.pop(field)
-                return field if key else value
-        else:
-            value = getattr(io_object, field, null)
-            if value is not null:
-                return field if key else value
-    variations = extra_variations or []
-    if search_variations or variations:
-        variations += WPS_FIELD_MAPPING.get(field, [])
-        for var in variations:
-            value = get_field(io_object, var, search_variations=False, only_variations=False, pop_found=pop_found)
+                    io_object.pop(name)
+                return name if key else value
+    else:
+        for name in names:
+            value = getattr(io_object, name, null)
             if value is not null:
-                return var if key else value
+                return name if key else value
     return default
 
 
@@ -3550,13 +3562,14 @@ def merge_io_fields(wps_io, cwl_io):
     # (see function 'json2wps_io' for detail)
     # Important to have 'data_format' after, as it depends on 'supported_formats' processed an interation before.
     # Important to have 'metadata' before 'supported_formats' that interact together during mixed typed exchanges.
-    wps_field_list = ["metadata"] + list(set(WPS_FIELD_MAPPING) - {"metadata"}) + ["_default", "data_format"]
-    for field_type in wps_field_list:
+    for field_type in WPS_FIELD_MERGE:
         cwl_field = get_field(cwl_io, field_type)
+        if cwl_field is null:
+            continue  # nothing to complement from CWL, WPS field is kept as is
         wps_field = get_field(wps_io, field_type)
         # employ provided formats if different (keep WPS), or if CWL offers more that were missing in WPS
         # because 'updated_io_list' contains the WPS I/O already, only need to push differences found in CWL
-        if _are_different_and_set(wps_field, cwl_field) or (wps_field is null and cwl_field is not null):
+        if _are_different_and_set(wps_field, cwl_field) or wps_field is null:
             # because WPS Bbox is mapped against CWL Complex, adjust format to metadata in that case
             # WPS expected to have no formats, since not a complex
             # CWL expected to have only 1 because 'format' field is unique (see also 'cwl2wps_io' schema handling)
@@ -3575,7 +3588,7 @@ def merge_io_fields(wps_io, cwl_io):
                     ))
                     set_field(wps_io, "metadata", wps_field)
                 continue
-            if field_type == "supported_formats" and cwl_field is not null:
+            if field_type == "supported_formats":
                 wps_field = merge_io_formats(wps_field, cwl_field)
             # default 'data_format' must be one of the 'supported_formats'
             # avoid setting something invalid in this case, or it will cause problem after
@@ -3620,32 +3633,29 @@ def merge_package_io(wps_io_list, cwl_io_list, io_select):
     """
     if not isinstance(cwl_io_list, list):
         raise PackageTypeError("CWL I/O definitions must be provided, empty list if none required.")
+    cwl_io_dict = {get_field(cwl_io, "identifier", search_variations=True): deepcopy(cwl_io) for cwl_io in cwl_io_list}
     if not wps_io_list:
-        wps_io_list = []
-    wps_io_dict = OrderedDict((get_field(wps_io, "identifier", search_variations=True), deepcopy(wps_io))
-                              for wps_io in wps_io_list)
-    cwl_io_dict = OrderedDict((get_field(cwl_io, "identifier", search_variations=True), deepcopy(cwl_io))
-                              for cwl_io in cwl_io_list)
-    missing_io_list = [cwl_io for cwl_io in cwl_io_dict if cwl_io not in wps_io_dict]  # preserve ordering
+        # nothing to merge, all I/O can only be inferred using CWL->WPS definitions
+        return [wps2json_io(cwl_io) for cwl_io in cwl_io_dict.values()]
+    wps_io_dict = {get_field(wps_io, "identifier", search_variations=True): deepcopy(wps_io) for wps_io in wps_io_list}
     updated_io_list = []
 
     # WPS I/O by id not matching any converted CWL->WPS I/O are discarded
     # otherwise, evaluate provided WPS I/O definitions and find potential new information to be merged
-    for cwl_id in cwl_io_dict:
-        cwl_io = cwl_io_dict[cwl_id]
-        if cwl_id in missing_io_list:
+    for cwl_id, cwl_io in cwl_io_dict.items():
+        wps_io_json = wps_io_dict.get(cwl_id)
+        if wps_io_json is None:
             json_io = wps2json_io(cwl_io)
             updated_io_list.append(json_io)
             continue  # missing WPS I/O can only be inferred using CWL->WPS definitions
 
         # enforce expected CWL->WPS I/O required parameters
+        # (identifier of the CWL I/O object was already resolved as key of the mapping)
         cwl_io_json = cwl_io.json
-        wps_io_json = wps_io_dict[cwl_id]
-        cwl_identifier = get_field(cwl_io_json, "identifier", search_variations=True)
         cwl_title = get_field(wps_io_json, "title", search_variations=True)
         wps_io_json.update({
-            "identifier": cwl_identifier,
-            "title": cwl_title if cwl_title is not null else cwl_identifier
+            "identifier": cwl_id,
+            "title": cwl_title if cwl_title is not null else cwl_id
         })
         # attempt to infer additional typing or constraints from OpenAPI schema if available
         wps_io_schema = get_field(wps_io_json, "schema")
@@ -1107,6 +1107,10 @@ def _check_package_file(cwl_file_path_or_url):
     :returns: validated absolute path or URL of the file reference.
     :raises PackageRegistrationError: in case of missing file, invalid format or invalid HTTP status code.
     """
+    # validate the extension first to avoid remote request or file system access for an invalid reference
+    file_ext = os.path.splitext(cwl_file_path_or_url)[-1][1:]
+    if file_ext not in PACKAGE_EXTENSIONS:
+        raise PackageRegistrationError(f"Not a valid CWL file type: '{file_ext}'.")
     if is_remote_file(cwl_file_path_or_url):
         cwl_path = cwl_file_path_or_url
         cwl_resp = request_extra("head", cwl_path, settings=get_settings())
@@ -1117,10 +1121,6 @@ def _check_package_file(cwl_file_path_or_url):
         cwl_path = os.path.abspath(cwl_path)
         if not os.path.isfile(cwl_path):
             raise PackageRegistrationError(f"Cannot find CWL file at: '{cwl_file_path_or_url}'.")
-
-    file_ext = os.path.splitext(cwl_path)[-1].replace(".", "")
-    if file_ext not in PACKAGE_EXTENSIONS:
-        raise PackageRegistrationError(f"Not a valid CWL file type: '{file_ext}'.")
     return cwl_path
 
 
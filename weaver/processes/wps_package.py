@@ -21,6 +21,7 @@ import sys
 import tempfile
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, overload
 from urllib.parse import parse_qsl, urlparse
 
@@ -32,6 +33,7 @@ from cwltool.context import LoadingContext, RuntimeContext
 from cwltool.factory import Factory as CWLFactory, WorkflowStatus as CWLException
 from cwltool.process import use_custom_schema
 from pyramid.httpexceptions import HTTPOk, HTTPServiceUnavailable
+from pyramid.threadlocal import manager as pyramid_threadlocal_manager
 from pywps import Process
 from pywps.inout.basic import SOURCE_TYPE, FileHandler, IOHandler, NoneIOHandler
 from pywps.inout.formats import Format
@@ -245,8 +247,8 @@ def get_process_location(process_id_or_url, data_source=None):
     :param data_source: identifier of the data source to map to specific ADES, or map to localhost if ``None``.
     :return: URL of EMS or ADES WPS-REST DescribeProcess.
     """
-    # if an URL was specified, return it as is
-    if urlparse(process_id_or_url).scheme != "":
+    # if an URL was specified, return it as is (any scheme requires ':', avoid parsing plain process IDs)
+    if ":" in process_id_or_url and urlparse(process_id_or_url).scheme != "":
         return process_id_or_url
     data_source_url = retrieve_data_source_url(data_source)
     process_id = get_sane_name(process_id_or_url, min_len=1)
@@ -273,7 +275,10 @@ def get_package_workflow_steps(package_dict_or_url):
             step_package_ref = workflow_steps[step].get("run")
             # if a local file reference was specified, convert it to process id
             package_ref_name, package_ref_ext = os.path.splitext(step_package_ref)
-            if urlparse(step_package_ref).scheme == "" and package_ref_ext.replace(".", "") in PACKAGE_EXTENSIONS:
+            if (
+                package_ref_ext[1:] in PACKAGE_EXTENSIONS and
+                (":" not in step_package_ref or urlparse(step_package_ref).scheme == "")
+            ):
                 step_package_ref = package_ref_name
             workflow_steps_ids.append({"name": step, "reference": step_package_ref})
     return workflow_steps_ids
@@ -468,6 +473,83 @@ def _load_supported_schemas():
         PACKAGE_SCHEMA_CACHE[version] = (schema_base, schema_data)
 
 
+def _fetch_package_steps(step_process_urls):
+    # type: (List[str]) -> List[Tuple[CWL, str]]
+    """
+    Retrieves the sub-packages of :term:`Workflow` steps from their process locations.
+
+    Sub-packages are retrieved concurrently when there are many of them, since each one requires remote requests.
+    The :mod:`pyramid` thread-local context of the caller is applied to workers to resolve the same settings.
+
+    :param step_process_urls: Unique process locations of the sub-packages to retrieve.
+    :returns: Sub-package body and its package reference name, in the same order as the process locations.
+    """
+    if len(step_process_urls) <= 1:
+        return [_get_process_package(url) for url in step_process_urls]
+
+    threadlocals = pyramid_threadlocal_manager.get()
+
+    def _fetch_step(_step_process_url):
+        # type: (str) -> Tuple[CWL, str]
+        pyramid_threadlocal_manager.push(threadlocals)
+        try:
+            return _get_process_package(_step_process_url)
+        finally:
+            pyramid_threadlocal_manager.pop()
+
+    max_workers = min(len(step_process_urls), 8)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_fetch_step, step_process_urls))
+
+
+def _load_package_steps(package_dict, data_source, tmp_dir):
+    # type: (CWL, Optional[str], str) -> CWL_WorkflowStepPackageMap
+    """
+    Retrieves and dumps the sub-packages of all nested :term:`Workflow` steps of the package.
+
+    The hierarchy of steps is expanded level by level. Each distinct process location referenced anywhere in the
+    hierarchy is retrieved and dumped only once, even when shared by multiple steps or sub-workflows, and all new
+    references of a same level are retrieved concurrently. Every :term:`Workflow` step is then updated to run the
+    sub-package file generated for its reference.
+
+    :param package_dict: Package content representation as a dictionary, updated in place.
+    :param data_source: Identifier of the :term:`Data Source` to map to specific :term:`ADES`.
+    :param tmp_dir: Location of the temporary directory where sub-package files are dumped.
+    :returns: Mapping of each direct step name of the package to its package ID and :term:`CWL` definition.
+    """
+    step_packages_loaded = {}  # type: Dict[str, Tuple[CWL, str]]
+    workflow_step_urls = []  # type: List[Tuple[CWL, Dict[str, str]]]
+    pending = [package_dict]
+    while pending:
+        level_urls = []
+        for package in pending:
+            step_urls = {
+                step["name"]: get_process_location(step["reference"], data_source)
+                for step in get_package_workflow_steps(package)
+            }
+            workflow_step_urls.append((package, step_urls))
+            level_urls.extend(url for url in step_urls.values() if url not in step_packages_loaded)
+        level_urls = list(dict.fromkeys(level_urls))
+        for url, (package_body, package_name) in zip(level_urls, _fetch_package_steps(level_urls)):
+            step_packages_loaded[url] = (_update_package_compatibility(package_body), package_name)
+        pending = [step_packages_loaded[url][0] for url in level_urls]
+
+    for package, step_urls in workflow_step_urls:
+        for step_name, url in step_urls.items():
+            package["steps"][step_name]["run"] = step_packages_loaded[url][1]
+    for package_body, package_name in step_packages_loaded.values():
+        package_body["inputs"] = normalize_ordered_io(package_body["inputs"])
+        package_body["outputs"] = normalize_ordered_io(package_body["outputs"])
+        with open(os.path.join(tmp_dir, package_name), mode="w", encoding="utf-8") as f:
+            f.write(json.dumps(package_body))
+
+    _, step_urls = workflow_step_urls[0]
+    return {
+        step_name: {"id": step_packages_loaded[url][1], "package": step_packages_loaded[url][0]}
+        for step_name, url in step_urls.items()
+    }
+
+
 @overload
 def _load_package_content(package_dict,                             # type: CWL
                           package_name=PACKAGE_DEFAULT_FILE_NAME,   # type: str
@@ -546,17 +628,7 @@ def _load_package_content(package_dict,                             # type: CWL
     # for workflows, retrieve each 'sub-package' file
     package_dict = _update_package_compatibility(package_dict)
     package_type = _get_package_type(package_dict)
-    workflow_steps = get_package_workflow_steps(package_dict)
-    step_packages = {}
-    for step in workflow_steps:
-        # generate sub-package file and update workflow step to point to it
-        step_process_url = get_process_location(step["reference"], data_source)
-        package_body, package_name = _get_process_package(step_process_url)
-        _load_package_content(package_body, package_name, tmp_dir=tmp_dir,
-                              data_source=data_source, only_dump_file=True)
-        step_name = step["name"]
-        package_dict["steps"][step_name]["run"] = package_name
-        step_packages[step_name] = {"id": package_name, "package": package_body}
+    step_packages = _load_package_steps(package_dict, data_source, tmp_dir)
 
     # fix I/O to preserve ordering from dump/load, and normalize them to consistent list of objects
     process_offering_hint = process_offering or {}
@@ -566,14 +638,16 @@ def _load_package_content(package_dict,                             # type: CWL
     package_dict["outputs"] = normalize_ordered_io(package_dict["outputs"], order_hints=package_output_hint)
 
     with open(tmp_json_cwl, mode="w", encoding="utf-8") as f:
-        json.dump(package_dict, f)
+        f.write(json.dumps(package_dict))
     if only_dump_file:
         return
 
     _load_supported_schemas()
     factory = CWLFactory(loading_context=loading_context, runtime_context=runtime_context)
-    package = factory.make(tmp_json_cwl)  # type: CWLFactoryCallable
-    shutil.rmtree(tmp_dir)
+    try:
+        package = factory.make(tmp_json_cwl)  # type: CWLFactoryCallable
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
     return package, package_type, step_packages
 
 
@@ -663,17 +737,19 @@ def _update_package_metadata(wps_package_metadata, cwl_package_package):
         and isinstance(cwl_package_package["$namespaces"], dict)
     ):
         metadata = wps_package_metadata.get("metadata", [])
-        namespaces_inv = {v: k for k, v in cwl_package_package["$namespaces"]}
+        namespaces = list(cwl_package_package["$namespaces"].items())
         for schema in cwl_package_package["$schemas"]:
-            for namespace_url in namespaces_inv:
+            for namespace_name, namespace_url in namespaces:
                 if schema.startswith(namespace_url):
-                    metadata.append({"title": namespaces_inv[namespace_url], "href": schema})
+                    metadata.append({"title": namespace_name, "href": schema})
+                    break
         wps_package_metadata["metadata"] = metadata
 
     if "s:keywords" in cwl_package_package and isinstance(cwl_package_package["s:keywords"], list):
-        wps_package_metadata["keywords"] = list(
-            set(wps_package_metadata.get("keywords", [])) | set(cwl_package_package.get("s:keywords", []))
-        )
+        # dict keys used as ordered set to preserve keywords order while removing duplicates
+        wps_package_metadata["keywords"] = list(dict.fromkeys(
+            [*wps_package_metadata.get("keywords", []), *cwl_package_package["s:keywords"]]
+        ))
 
 
 def _patch_wps_process_description_url(reference, process_hint):
@@ -1240,6 +1316,8 @@ class WpsPackage(Process):
         self.response = None                 # type: Optional[ExecuteResponse]
         self._job = None                     # type: Optional[Job]
         self._job_status_file = None         # type: Optional[str]
+        self._log_handler = None             # type: Optional[logging.Handler]
+        self._log_handler_loggers = []       # type: List[logging.Logger]
 
         self.payload = payload
         self.package = package
@@ -1311,6 +1389,8 @@ class WpsPackage(Process):
         log_file_formatter.converter = time.gmtime
         log_file_handler.setFormatter(log_file_formatter)
 
+        self._log_handler = log_file_handler
+
         # prepare package logger
         self.logger = logging.getLogger(f"{LOGGER.name}|{self.package_id}")
         self.logger.addHandler(log_file_handler)
@@ -1323,6 +1403,7 @@ class WpsPackage(Process):
         cwl_logger = logging.getLogger("cwltool")
         cwl_logger.addHandler(log_file_handler)
         cwl_logger.setLevel(self.log_level)
+        self._log_handler_loggers = [self.logger, job_logger, cwl_logger]
 
         # add stderr/stdout CWL hook to capture logs/prints/echos from subprocess execution
         # using same file so all kind of message are kept in chronological order of generation
@@ -1353,6 +1434,24 @@ class WpsPackage(Process):
         weaver_tweens_logger = logging.getLogger("weaver.tweens")
         weaver_tweens_logger.addHandler(log_file_handler)
         weaver_tweens_logger.setLevel(self.log_level)
+        self._log_handler_loggers.append(weaver_tweens_logger)
+
+    def teardown_loggers(self):
+        # type: () -> None
+        """
+        Removes the package log file handler from all loggers configured by :meth:`setup_loggers`.
+
+        Since the loggers are shared across executions within the same worker, the file handler of completed jobs
+        must be removed. Otherwise, handlers accumulate over executions and each message gets written to the log
+        files of every previous job.
+        """
+        if self._log_handler is None:
+            return
+        for logger in self._log_handler_loggers:
+            logger.removeHandler(self._log_handler)
+        self._log_handler.close()
+        self._log_handler = None
+        self._log_handler_loggers = []
 
     def insert_package_log(self, result):
         # type: (Union[CWL_Results, CWLException]) -> List[str]
@@ -1868,7 +1967,11 @@ class WpsPackage(Process):
             error_msg = f"Package completed with errors. Server logs: [{self.log_file}], Available at: [{log_url}]"
             self.update_status(error_msg, self.percent, Status.FAILED)
             raise
-        self.update_status("Package operations complete.", PACKAGE_PROGRESS_DONE, Status.SUCCEEDED)
+        else:
+            self.update_status("Package operations complete.", PACKAGE_PROGRESS_DONE, Status.SUCCEEDED)
+        finally:
+            # remove job log handlers from shared loggers, even if the final status update failed
+            self.teardown_loggers()
         return self.response
 
     def must_fetch(self, input_ref, input_type):
@@ -1913,9 +2016,8 @@ class WpsPackage(Process):
         :return: :term:`CWL` input values.
         """
         cwl_inputs = {}
-        for input_id in wps_inputs:
+        for input_id, input_occurs in wps_inputs.items():
             # skip empty inputs (if that is even possible...)
-            input_occurs = wps_inputs[input_id]
             if len(input_occurs) <= 0:
                 continue
             # process single occurrences
@@ -1926,8 +2028,12 @@ class WpsPackage(Process):
                 # extend array data that allow max_occur > 1
                 # drop invalid inputs returned as None
                 if io_def.array:
-                    input_href = [self.make_location_input(io_def.type, input_def) for input_def in input_occurs]
-                    input_href = [cwl_input for cwl_input in input_href if cwl_input is not None]
+                    input_href = [
+                        cwl_input for cwl_input in (
+                            self.make_location_input(io_def.type, input_def) for input_def in input_occurs
+                        )
+                        if cwl_input is not None
+                    ]
                 else:
                     input_href = self.make_location_input(io_def.type, input_i)
                 if input_href:
@@ -2168,40 +2274,42 @@ class WpsPackage(Process):
         Maps `CWL` result outputs to corresponding `WPS` outputs.
         """
         for output_id in self.request.outputs:  # iterate over original WPS outputs, extra such as logs are dropped
-            if isinstance(cwl_result[output_id], list) and not isinstance(self.response.outputs[output_id], list):
+            result = cwl_result[output_id]
+            wps_output = self.response.outputs[output_id]
+            if isinstance(result, list) and not isinstance(wps_output, list):
                 # FIXME: support multiple outputs cardinality (https://github.com/crim-ca/weaver/issues/25)
-                if len(cwl_result[output_id]) > 1:
+                if len(result) > 1:
                     self.logger.warning(
                         "Dropping additional output values (%s total), only 1 supported per identifier.",
-                        len(cwl_result[output_id])
+                        len(result)
                     )
                 # provide more details than poorly descriptive IndexError
-                if not len(cwl_result[output_id]):
+                if not len(result):
                     raise PackageExecutionError(
                         f"Process output '{output_id}' expects at least one value but none was found. "
                         "Possible incorrect glob pattern definition in CWL Application Package."
                     )
-                cwl_result[output_id] = cwl_result[output_id][0]  # expect only one output
+                result = cwl_result[output_id] = result[0]  # expect only one output
 
-            if isinstance(cwl_result[output_id], dict):
-                if "location" not in cwl_result[output_id] and os.path.isfile(str(cwl_result[output_id])):
+            if isinstance(result, dict):
+                if "location" not in result and os.path.isfile(str(result)):
                     raise PackageTypeError(
                         f"Process output '{output_id}' defines CWL type other than 'File'. "
                         "Application output results must use 'File' type to return file references."
                     )
-                if "location" in cwl_result[output_id]:
+                if "location" in result:
                     self.make_location_output(cwl_result, output_id)
-                if isinstance(self.response.outputs[output_id], ComplexOutput):
+                if isinstance(wps_output, ComplexOutput):
                     continue
 
                 # unpack CWL File into Bounding Box
-                if isinstance(self.response.outputs[output_id], BoundingBoxOutput):
+                if isinstance(wps_output, BoundingBoxOutput):
                     self.make_bbox_output(cwl_result, output_id)
                     continue
 
-            data_output = self.make_literal_output(cwl_result[output_id])
-            self.response.outputs[output_id].data = data_output
-            self.response.outputs[output_id].as_reference = False
+            data_output = self.make_literal_output(result)
+            wps_output.data = data_output
+            wps_output.as_reference = False
             self.logger.info("Resolved WPS output [%s] as literal data", output_id)
 
     @staticmethod
@@ -2242,7 +2350,10 @@ class WpsPackage(Process):
             - :func:`weaver.wps.load_pywps_config`
         """
         s3_bucket = self.settings.get("weaver.wps_output_s3_bucket")
-        result_loc = cwl_result[output_id]["location"].replace("file://", "").rstrip("/")
+        result_loc = cwl_result[output_id]["location"]
+        if result_loc.startswith("file://"):
+            result_loc = result_loc[7:]
+        result_loc = result_loc.rstrip("/")
         result_path = os.path.split(result_loc)[-1]
         result_type = cwl_result[output_id].get("class", PACKAGE_FILE_TYPE)
         result_cwl_fmt = cwl_result[output_id].get("format")
@@ -2446,8 +2557,10 @@ class WpsPackage(Process):
             job_type = "step"
 
         # Progress made with steps presumes that they are done sequentially and have the same progress weight
-        start_step_progress = self.map_step_progress(len(self.step_launched), max(1, len(self.step_packages)))
-        end_step_progress = self.map_step_progress(len(self.step_launched) + 1, max(1, len(self.step_packages)))
+        step_index = len(self.step_launched)
+        step_count = max(1, len(self.step_packages))
+        start_step_progress = self.map_step_progress(step_index, step_count)
+        end_step_progress = self.map_step_progress(step_index + 1, step_count)
 
         self.step_launched.append(job_name)
         self.update_status(f"Preparing to launch {job_type} {job_name}.", start_step_progress, Status.RUNNING)
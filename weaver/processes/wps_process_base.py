@@ -4,6 +4,7 @@ import os
 import shutil
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from requests.structures import CaseInsensitiveDict
@@ -33,7 +34,7 @@ from weaver.wps.utils import get_wps_output_dir, get_wps_output_url, map_wps_out
 from weaver.wps_restapi import swagger_definitions as sd
 
 if TYPE_CHECKING:
-    from typing import Any, Optional, Union
+    from typing import Any, Dict, List, Optional, Tuple, Union
 
     from weaver.typedefs import (
         AnyCookiesContainer,
@@ -50,6 +51,7 @@ if TYPE_CHECKING:
         JSON,
         UpdateStatusPartialFunction
     )
+    from weaver.utils import AnyOutputMethod
     from weaver.wps.service import WorkerRequest
 
 LOGGER = logging.getLogger(__name__)
@@ -96,6 +98,9 @@ class WpsProcessInterface(abc.ABC):
         self.settings = get_settings()
         self.update_status = update_status  # type: UpdateStatusPartialFunction
         self.temp_staging = set()
+        self.hosted_references = {}  # type: Dict[str, str]
+        self._wps_output_url = None  # type: Optional[str]
+        self._wps_output_dir = None  # type: Optional[str]
 
     def execute(self, workflow_inputs, out_dir, expected_outputs):
         # type: (CWL_RuntimeInputsMap, str, CWL_ExpectedOutputs) -> None
@@ -125,35 +130,37 @@ class WpsProcessInterface(abc.ABC):
         process_inputs = self.format_inputs(staged_inputs)
         process_outputs = self.format_outputs(expect_outputs)
 
+        job_failed = True
         try:
-            self.update_status("Executing remote process job.",
-                               RemoteJobProgress.EXECUTION, Status.RUNNING)
-            monitor_ref = self.dispatch(process_inputs, process_outputs)
-            self.update_status("Monitoring remote process job until completion.",
-                               RemoteJobProgress.MONITORING, Status.RUNNING)
-            job_success = self.monitor(monitor_ref)
-            if not job_success:
-                raise PackageExecutionError("Failed dispatch and monitoring of remote process execution.")
-        except Exception as exc:
-            err_msg = f"{fully_qualified_name(exc)}: {exc!s}"
-            err_ctx = "Dispatch and monitoring of remote process caused an unhandled error."
-            LOGGER.exception("%s [%s]", err_ctx, err_msg, exc_info=exc)
-            self.update_status(err_msg, RemoteJobProgress.CLEANUP, Status.RUNNING, error=exc)
-            self.update_status("Running final cleanup operations following failed execution.",
+            try:
+                self.update_status("Executing remote process job.",
+                                   RemoteJobProgress.EXECUTION, Status.RUNNING)
+                monitor_ref = self.dispatch(process_inputs, process_outputs)
+                self.update_status("Monitoring remote process job until completion.",
+                                   RemoteJobProgress.MONITORING, Status.RUNNING)
+                job_success = self.monitor(monitor_ref)
+                if not job_success:
+                    raise PackageExecutionError("Failed dispatch and monitoring of remote process execution.")
+            except Exception as exc:
+                err_msg = f"{fully_qualified_name(exc)}: {exc!s}"
+                err_ctx = "Dispatch and monitoring of remote process caused an unhandled error."
+                LOGGER.exception("%s [%s]", err_ctx, err_msg, exc_info=exc)
+                self.update_status(err_msg, RemoteJobProgress.CLEANUP, Status.RUNNING, error=exc)
+                raise PackageExecutionError(err_ctx) from exc
+
+            self.update_status("Retrieving job results definitions.",
+                               RemoteJobProgress.RESULTS, Status.RUNNING)
+            results = self.get_results(monitor_ref)
+            self.update_status("Staging job outputs from remote process.",
+                               RemoteJobProgress.STAGE_OUT, Status.RUNNING)
+            self.stage_results(results, expected_outputs, out_dir)
+            job_failed = False
+        finally:
+            # single cleanup location, also applied if results retrieval or staging failed
+            cleanup_msg = "following failed execution" if job_failed else "before completion"
+            self.update_status(f"Running final cleanup operations {cleanup_msg}.",
                                RemoteJobProgress.CLEANUP, Status.RUNNING)
             self.cleanup()
-            raise PackageExecutionError(err_ctx) from exc
-
-        self.update_status("Retrieving job results definitions.",
-                           RemoteJobProgress.RESULTS, Status.RUNNING)
-        results = self.get_results(monitor_ref)
-        self.update_status("Staging job outputs from remote process.",
-                           RemoteJobProgress.STAGE_OUT, Status.RUNNING)
-        self.stage_results(results, expected_outputs, out_dir)
-
-        self.update_status("Running final cleanup operations before completion.",
-                           RemoteJobProgress.CLEANUP, Status.RUNNING)
-        self.cleanup()
 
         self.update_status("Execution of remote process execution completed successfully.",
                            RemoteJobProgress.COMPLETED, Status.SUCCEEDED)
@@ -241,6 +248,7 @@ class WpsProcessInterface(abc.ABC):
                     shutil.rmtree(path)
             except OSError:
                 LOGGER.warning("Ignore failure to clean up temporary staging path: [%s]", path)
+        self.hosted_references.clear()  # hosted references could point to removed temporary staging locations
 
     def get_auth_headers(self):
         # type: () -> AnyHeadersContainer
@@ -296,23 +304,35 @@ class WpsProcessInterface(abc.ABC):
         """
         Hosts an intermediate reference between :term:`Workflow` steps for processes that require remote access.
 
+        References already hosted by this process are reused, to avoid linking the same file multiple times.
+
         :param reference: Intermediate file or directory location (local path expected).
         :return: Hosted temporary HTTP file or directory location.
         """
-        wps_out_url = get_wps_output_url(self.settings)
-        wps_out_dir = get_wps_output_dir(self.settings)
-        ref_path = os.path.realpath(reference.replace("file://", ""))  # in case CWL->WPS outputs link was made
-        ref_path += "/" if reference.endswith("/") else ""
+        ref_href = self.hosted_references.get(reference)
+        if ref_href is not None:
+            LOGGER.debug("Hosting file [%s] skipped since already hosted as [%s]", reference, ref_href)
+            return ref_href
+        if self._wps_output_url is None:
+            self._wps_output_url = get_wps_output_url(self.settings)
+            self._wps_output_dir = get_wps_output_dir(self.settings)
+        wps_out_url = self._wps_output_url
+        wps_out_dir = self._wps_output_dir
         if reference.startswith(wps_out_dir):
-            ref_href = ref_path.replace(wps_out_dir, wps_out_url, 1)
+            # already accessible from WPS outputs location, no need to resolve links to obtain the hosted location
+            ref_href = wps_out_url + reference[len(wps_out_dir):]
             LOGGER.debug("Hosting file [%s] skipped since already on WPS outputs as [%s]", reference, ref_href)
         else:
+            ref_path = reference[7:] if reference.startswith("file://") else reference
+            ref_path = os.path.realpath(ref_path)  # in case CWL->WPS outputs link was made
+            ref_path += "/" if reference.endswith("/") else ""
             tmp_out_dir = tempfile.mkdtemp(dir=wps_out_dir)
             ref_link = fetch_reference(ref_path, tmp_out_dir, out_listing=False,
                                        settings=self.settings, out_method=OutputMethod.LINK)
             ref_href = ref_link.replace(wps_out_dir, wps_out_url, 1)
             self.temp_staging.add(tmp_out_dir)
             LOGGER.debug("Hosting file [%s] as [%s] on [%s]", reference, ref_link, ref_href)
+        self.hosted_references[reference] = ref_href
         return ref_href
 
     def stage_results(self, results, expected_outputs, out_dir):
@@ -332,7 +352,15 @@ class WpsProcessInterface(abc.ABC):
             the expected file extension based on Content-Type format. Since the remote :term:`WPS` :term:`Process`
             doesn't necessarily produce file names with the output ID as expected to find them (could be anything),
             staging must patch locations to let :term:`CWL` runtime resolve the files according to glob definitions.
+
+        Remote file results are downloaded concurrently since each one mostly waits after network transfers.
+        Because their file name can be resolved only once downloaded (e.g.: using ``Content-Disposition``), each one
+        is downloaded in a separate temporary directory. All results are then placed in the output directory following
+        their original order, such that the last one takes precedence if their names are the same, as when fetched
+        sequentially. Directory, :term:`S3` and local references are always fetched sequentially in that order.
         """
+        staged_results = []  # type: List[Tuple[str, str, AnyOutputMethod, bool]]
+        out_dir = out_dir.rstrip("/")
         for result in results:
             res_id = get_any_id(result)
             if res_id not in expected_outputs:
@@ -342,29 +370,56 @@ class WpsProcessInterface(abc.ABC):
             result_values = get_any_value(result)
             if not isinstance(result_values, list):
                 result_values = [result_values]
-            cwl_out_dir = "/".join([out_dir.rstrip("/"), res_id])
+            cwl_out_dir = f"{out_dir}/{res_id}"
             os.makedirs(cwl_out_dir, mode=0o700, exist_ok=True)
             for value in result_values:
-                src_name = value.split("/")[-1]
-                dst_path = "/".join([cwl_out_dir, src_name])
+                src_name = value.rsplit("/", 1)[-1]
+                dst_path = f"{cwl_out_dir}/{src_name}"
                 # performance improvement:
                 #   Bypass download if file can be resolved as local resource (already fetched or same server).
                 #   Because CWL expects the file to be in specified 'out_dir', make a link for it to be found
                 #   even though the file is stored in the full job output location instead (already staged by step).
                 map_path = map_wps_output_location(value, self.settings)
-                out_method = OutputMethod.COPY
                 if map_path:
                     LOGGER.info("Detected result [%s] from [%s] as local reference to this instance. "
                                 "Skipping fetch and using local copy in output destination: [%s]",
                                 res_id, value, dst_path)
                     LOGGER.debug("Mapped result [%s] to local reference: [%s]", value, map_path)
-                    src_path = map_path
-                    out_method = OutputMethod.LINK
+                    staged_results.append((map_path, cwl_out_dir, OutputMethod.LINK, False))
                 else:
                     LOGGER.info("Fetching result [%s] from [%s] to CWL output destination: [%s]",
                                 res_id, value, dst_path)
-                    src_path = value
+                    # S3 clients are created from the shared default 'boto3' session, which is not thread-safe
+                    concurrent = not value.startswith("s3://") and not value.endswith("/")
+                    staged_results.append((value, cwl_out_dir, OutputMethod.COPY, concurrent))
+
+        remote_fetches = [staged for staged in staged_results if staged[-1]]
+        if len(remote_fetches) <= 1:
+            for src_path, cwl_out_dir, out_method, _ in staged_results:
                 fetch_reference(src_path, cwl_out_dir, out_method=out_method, settings=self.settings)
+            return
+
+        def _fetch_remote(_fetch_src, _fetch_dir):
+            # type: (str, str) -> str
+            return fetch_reference(_fetch_src, _fetch_dir, out_method=OutputMethod.COPY, settings=self.settings)
+
+        # hidden directories to avoid matching CWL output glob patterns
+        fetch_dirs = [tempfile.mkdtemp(prefix=".fetch-", dir=out_dir) for _ in remote_fetches]
+        try:
+            max_workers = min(len(remote_fetches), 8)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched_paths = iter(list(executor.map(
+                    _fetch_remote, [staged[0] for staged in remote_fetches], fetch_dirs
+                )))
+            for src_path, cwl_out_dir, out_method, concurrent in staged_results:
+                if concurrent:
+                    fetched_path = next(fetched_paths)
+                    os.replace(fetched_path, os.path.join(cwl_out_dir, os.path.basename(fetched_path)))
+                else:
+                    fetch_reference(src_path, cwl_out_dir, out_method=out_method, settings=self.settings)
+        finally:
+            for fetch_dir in fetch_dirs:
+                shutil.rmtree(fetch_dir, ignore_errors=True)
 
     def stage_inputs(self, workflow_inputs):
         # type: (CWL_WorkflowInputs) -> JobInputs
@@ -372,31 +427,29 @@ class WpsProcessInterface(abc.ABC):
         Retrieves inputs for local staging if required for the following :term:`Job` execution.
         """
         execute_body_inputs = []
+        opensearch_file_prefix = f"{OpenSearchField.LOCAL_FILE_SCHEME}://"
         for workflow_input_key, workflow_input_value in workflow_inputs.items():
             if not isinstance(workflow_input_value, list):
                 workflow_input_value = [workflow_input_value]
             for workflow_input_value_item in workflow_input_value:
-                if isinstance(workflow_input_value_item, dict) and "location" in workflow_input_value_item:
-                    location = workflow_input_value_item["location"]
-                    # if the location came from a collected output resolved by cwltool from a previous Workflow step
-                    # obtained directory type does not contain the expected trailing slash for Weaver reference checks
-                    input_class = workflow_input_value_item.get("class", PACKAGE_FILE_TYPE)
-                    if input_class == PACKAGE_DIRECTORY_TYPE:
-                        location = f"{location.rstrip('/')}/"
-                    execute_body_inputs.append({"id": workflow_input_key, "href": location})
-                else:
+                if not isinstance(workflow_input_value_item, dict) or "location" not in workflow_input_value_item:
                     execute_body_inputs.append({"id": workflow_input_key, "data": workflow_input_value_item})
-
-        for exec_input in execute_body_inputs:
-            if "href" in exec_input and isinstance(exec_input["href"], str):
-                LOGGER.debug("Original input location [%s] : [%s]", exec_input["id"], exec_input["href"])
-                if exec_input["href"].startswith(f"{OpenSearchField.LOCAL_FILE_SCHEME}://"):
-                    exec_href = exec_input["href"][len(OpenSearchField.LOCAL_FILE_SCHEME):]
-                    exec_input["href"] = f"file{exec_href}"
-                    LOGGER.debug("OpenSearch intermediate input [%s] : [%s]", exec_input["id"], exec_input["href"])
-                elif exec_input["href"].startswith("file://"):
-                    exec_input["href"] = self.host_reference(exec_input["href"])
-                    LOGGER.debug("Hosting intermediate input [%s] : [%s]", exec_input["id"], exec_input["href"])
+                    continue
+                location = workflow_input_value_item["location"]
+                # if the location came from a collected output resolved by cwltool from a previous Workflow step
+                # obtained directory type does not contain the expected trailing slash for Weaver reference checks
+                input_class = workflow_input_value_item.get("class", PACKAGE_FILE_TYPE)
+                if input_class == PACKAGE_DIRECTORY_TYPE:
+                    location = f"{location.rstrip('/')}/"
+                if isinstance(location, str):
+                    LOGGER.debug("Original input location [%s] : [%s]", workflow_input_key, location)
+                    if location.startswith(opensearch_file_prefix):
+                        location = f"file{location[len(OpenSearchField.LOCAL_FILE_SCHEME):]}"
+                        LOGGER.debug("OpenSearch intermediate input [%s] : [%s]", workflow_input_key, location)
+                    elif location.startswith("file://"):
+                        location = self.host_reference(location)
+                        LOGGER.debug("Hosting intermediate input [%s] : [%s]", workflow_input_key, location)
+                execute_body_inputs.append({"id": workflow_input_key, "href": location})
         return execute_body_inputs
 
 
@@ -436,7 +489,9 @@ class OGCAPIRemoteProcessBase(WpsProcessInterface, abc.ABC):
             "inputs": process_inputs,
             "outputs": process_outputs
         }
-        LOGGER.debug("Execute process %s body for [%s]:\n%s", self.process_type, self.process, repr_json(execute_body))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Execute process %s body for [%s]:\n%s",
+                         self.process_type, self.process, repr_json(execute_body))
         request_url = self.url + sd.process_jobs_service.path.format(process_id=self.process)
         response = self.make_request(method="POST", url=request_url, json=execute_body, retry=True)
         if response.status_code != 201:
@@ -457,23 +512,35 @@ class OGCAPIRemoteProcessBase(WpsProcessInterface, abc.ABC):
                            RemoteJobProgress.MONITORING, Status.RUNNING)
 
         retry = 0
+        job_update_prev = None
         while job_status_value not in JOB_STATUS_CATEGORIES[StatusCategory.FINISHED]:
             wait = wait_secs(retry)
             time.sleep(wait)
             retry += 1
 
             job_status_data = self.get_job_status(job_status_uri)
+            job_status_prev = job_status_value
             job_status_value = map_status(job_status_data["status"])
-
-            LOGGER.debug(get_log_monitor_msg(job_id, job_status_value,
-                                             job_status_data.get("percentCompleted", 0),
-                                             get_any_message(job_status_data), job_status_data.get("statusLocation")))
+            # restart from short delays when the remote job changes state (e.g.: accepted -> running)
+            # to follow up closely on new activity, while idle states keep increasing the delay between checks
+            if job_status_value != job_status_prev:
+                retry = 0
+
+            job_progress = job_status_data.get("percentCompleted", 0)
+            job_message = get_any_message(job_status_data)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(get_log_monitor_msg(job_id, job_status_value, job_progress,
+                                                 job_message, job_status_data.get("statusLocation")))
+            # avoid repeating the same status update (and its side effects) if nothing changed since previous check
+            job_update = (job_status_value, job_message, job_progress)
+            if job_update == job_update_prev:
+                continue
+            job_update_prev = job_update
             self.update_status(get_job_log_msg(status=job_status_value,
-                                               message=get_any_message(job_status_data),
-                                               progress=job_status_data.get("percentCompleted", 0),
+                                               message=job_message,
+                                               progress=job_progress,
                                                duration=job_status_data.get("duration", None)),  # get if available
-                               map_progress(job_status_data.get("percentCompleted", 0),
-                                            RemoteJobProgress.MONITORING, RemoteJobProgress.STAGE_OUT),
+                               map_progress(job_progress, RemoteJobProgress.MONITORING, RemoteJobProgress.STAGE_OUT),
                                Status.RUNNING)
 
         if job_status_value != Status.SUCCEEDED:
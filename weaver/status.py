@@ -84,6 +84,8 @@ JOB_STATUS_CATEGORIES = {
     ]),
 }
 
+JOB_STATUS_VALUES = frozenset(Status.values())
+
 # FIXME: see below detail in map_status about 'successful', partially compliant to OGC statuses
 # https://github.com/opengeospatial/ogcapi-processes/blob/ca8e90/core/openapi/schemas/statusCode.yaml
 JOB_STATUS_CODE_API = JOB_STATUS_CATEGORIES[StatusCompliant.OGC] - {Status.SUCCESSFUL}
@@ -181,6 +183,6 @@ def map_status(wps_status, compliant=StatusCompliant.OGC):
     if job_status == Status.SUCCESSFUL:
         job_status = Status.SUCCEEDED
 
-    if job_status in Status:
+    if job_status in JOB_STATUS_VALUES:
         return job_status
     return Status.UNKNOWN
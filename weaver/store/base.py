@@ -227,6 +227,7 @@ class StoreJobs(StoreInterface):
                   datetime_interval=None,   # type: Optional[DatetimeIntervalType]
                   group_by=None,            # type: Optional[Union[str, List[str]]]
                   request=None,             # type: Optional[Request]
+                  summary=False,            # type: bool
                   ):                        # type: (...) -> JobSearchResult
         raise NotImplementedError
 
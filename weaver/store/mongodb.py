@@ -775,6 +775,8 @@ class MongodbJobStore(StoreJobs, MongodbStore, ListingMixin):
 
     Uses `MongoDB` to store job attributes.
     """
+    # fields not required to represent the job status, potentially large and costly to retrieve for listings
+    job_details_fields = ("inputs", "outputs", "results", "exceptions", "logs", "statistics", "request", "response")
 
     def __init__(self, *args, **kwargs):
         # type: (*Any, **Any) -> None
@@ -938,6 +940,7 @@ class MongodbJobStore(StoreJobs, MongodbStore, ListingMixin):
                   datetime_interval=None,   # type: Optional[DatetimeIntervalType]
                   group_by=None,            # type: Optional[Union[str, List[str]]]
                   request=None,             # type: Optional[Request]
+                  summary=False,            # type: bool
                   ):                        # type: (...) -> JobSearchResult
         """
         Finds all jobs in `MongoDB` storage matching search filters to obtain results with requested paging or grouping.
@@ -987,6 +990,9 @@ class MongodbJobStore(StoreJobs, MongodbStore, ListingMixin):
         :param max_duration: maximum duration (seconds) between started time and current/finished time of jobs to find.
         :param datetime_interval: field used for filtering data by creation date with a given date or interval of date.
         :param group_by: one or many fields specifying categories to form matching groups of jobs (paging disabled).
+        :param summary:
+            Omit the potentially large :term:`Job` details (logs, results, exceptions, XML request and response, etc.)
+            from retrieved documents. Returned jobs only contain what is needed for their status representation.
         :returns: (list of jobs matching paging OR list of {categories, list of jobs, count}) AND total of matched job.
         """
         search_filters = {}
@@ -1002,6 +1008,8 @@ class MongodbJobStore(StoreJobs, MongodbStore, ListingMixin):
 
         sort_method = {"$sort": self._apply_sort_method(sort, Sort.CREATED, SortMethods.JOB)}
         pipeline.append(sort_method)
+        if summary:
+            pipeline.append({"$project": {field: False for field in self.job_details_fields}})
 
         # results by group categories or with job list paging
         if group_by:
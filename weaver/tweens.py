@@ -20,8 +20,6 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
-OWS_TWEEN_HANDLED = "OWS_TWEEN_HANDLED"
-
 
 # FIXME:
 #   https://github.com/crim-ca/weaver/issues/215
@@ -50,15 +48,19 @@ def error_repr(http_err):
     return f"({err_type}) <{err_code}> {err_repr!s}"
 
 
-def ows_response_tween(request, handler):
-    # type: (PyramidRequest, ViewHandler) -> AnyViewResponse
+def ows_response_tween(request, handler, raise_result_error=False):
+    # type: (PyramidRequest, ViewHandler, bool) -> AnyViewResponse
     """
     Tween that wraps any API request with appropriate dispatch of error conversion to handle formatting.
+
+    :param request: Request to be handled.
+    :param handler: Next tween or view handler to call with the request.
+    :param raise_result_error: Whether error responses returned (rather than raised) by the handler must be raised.
     """
     exc_log_lvl = logging.WARNING
     try:
         result = handler(request)
-        if hasattr(handler, OWS_TWEEN_HANDLED):
+        if raise_result_error:
             if isinstance(result, Exception) and not isinstance(result, (HTTPSuccessful, HTTPRedirection)):
                 raise result    # let the previous tween handler handle this case
         return result
@@ -122,8 +124,7 @@ def ows_response_tween_factory_ingress(handler, registry):  # noqa: F811
 
         # because the EXCVIEW will also wrap any exception raised that should before be handled by OWS response
         # to allow conversions to occur, use a flag that will re-raise the result
-        setattr(handler, OWS_TWEEN_HANDLED, True)
-        return ows_response_tween(request, handler)
+        return ows_response_tween(request, handler, raise_result_error=True)
     return handle_ows_tween
 
 
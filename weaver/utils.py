@@ -8,6 +8,7 @@ import io
 import logging
 import os
 import posixpath
+import random
 import re
 import shutil
 import sys
@@ -19,6 +20,7 @@ import warnings
 from concurrent.futures import ALL_COMPLETED, CancelledError, ThreadPoolExecutor, as_completed, wait as wait_until
 from copy import deepcopy
 from datetime import datetime
+from http.cookiejar import DefaultCookiePolicy
 from pkgutil import get_loader
 from typing import TYPE_CHECKING, overload
 from urllib.parse import ParseResult, parse_qsl, unquote, urlparse, urlunsplit
@@ -34,6 +36,7 @@ from beaker.exceptions import BeakerException
 from botocore.config import Config as S3Config
 from bs4 import BeautifulSoup
 from celery.app import Celery
+from dateutil.parser import parse as dt_parse
 from mypy_boto3_s3.literals import RegionName
 from pyramid.config import Configurator
 from pyramid.exceptions import ConfigurationError
@@ -53,6 +56,7 @@ from pyramid_celery import celery_app as app
 from pywps.inout.basic import UrlHandler
 from pywps.inout.outputs import MetaFile, MetaLink, MetaLink4
 from requests import HTTPError as RequestsHTTPError, Response
+from requests.adapters import HTTPAdapter
 from requests.structures import CaseInsensitiveDict
 from requests_file import FileAdapter
 from urlmatch import urlmatch
@@ -75,6 +79,11 @@ try:  # refactor in jsonschema==4.18.0
 except ImportError:  # pragma: no cover
     from jsonschema.validators import RefResolver as JsonSchemaRefResolver  # pylint: disable=E0611
 
+try:  # bindings to 'libyaml' are much faster to parse large documents, but they are not always available
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlSafeLoader
+
 if TYPE_CHECKING:
     import importlib.abc
     from types import FrameType, ModuleType
@@ -430,7 +439,7 @@ def get_any_id(info, default=None, pop=False, key=False):
     :param key: If enabled, return the matched key instead of the value.
     :returns: value of the matched `id-like` key or ``None`` if not found.
     """
-    for field in ["id", "identifier", "_id"]:
+    for field in ("id", "identifier", "_id"):
         if field in info:
             value = info.pop(field) if pop else info.get(field)
             return field if key else value
@@ -450,7 +459,7 @@ def get_any_value(info, default=None, file=True, data=True, pop=False, key=False
     :param key: If enabled, return the matched key instead of the value.
     :returns: Value (or key if requested) of the matched `value-like` key or ``None`` if not found.
     """
-    for check, field in [(file, "href"), (data, "value"), (file, "reference"), (data, "data")]:
+    for check, field in ((file, "href"), (data, "value"), (file, "reference"), (data, "data")):
         if check:
             value = info.pop(field, null) if pop else info.get(field, null)
             if value is not null:
@@ -1191,6 +1200,19 @@ def localize_datetime(dt, tz_name=None):
     return tz_aware_dt
 
 
+def parse_datetime(value):
+    # type: (str) -> datetime
+    """
+    Parse a datetime string, preferring the fast ISO-8601 parser and falling back to more permissive formats otherwise.
+
+    :raises ValueError: if the string cannot be parsed with any format.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return dt_parse(value)
+
+
 def get_file_header_datetime(dt):
     # type: (datetime) -> str
     """
@@ -1856,17 +1878,42 @@ def retry_on_cache_error(func):
     return wrapped
 
 
+_REQUEST_SESSIONS = threading.local()
+
+
+def get_request_session():
+    # type: () -> requests.Session
+    """
+    Obtains the session with pooled connections employed by :func:`request_extra` for the current thread and process.
+
+    Reusing the session allows connections to be kept alive between successive requests to the same servers, avoiding
+    new TCP and TLS handshakes for each of them. A distinct session is created for each thread since they are not
+    guaranteed to be thread-safe, and for each process to avoid sharing sockets of a parent process after a fork.
+
+    Cookies returned by responses are never persisted in the session to avoid leaking them across unrelated requests.
+    """
+    pid = os.getpid()
+    session = getattr(_REQUEST_SESSIONS, "session", None)
+    if session is None or getattr(_REQUEST_SESSIONS, "pid", None) != pid:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.mount("file://", FileAdapter())
+        _REQUEST_SESSIONS.session = session
+        _REQUEST_SESSIONS.pid = pid
+    return session
+
+
 def _request_call(method, url, kwargs):
     # type: (AnyRequestMethod, str, RequestCachingKeywords) -> Response
     """
     Request operation employed by :func:`request_extra` without caching.
     """
-    with requests.Session() as request_session:
-        if urlparse(url).scheme in ["", "file"]:
-            url = f"file://{os.path.abspath(url)}" if not url.startswith("file://") else url
-            request_session.mount("file://", FileAdapter())
-        resp = request_session.request(method, url, **kwargs)
-    return resp
+    if urlparse(url).scheme in ["", "file"]:
+        url = f"file://{os.path.abspath(url)}" if not url.startswith("file://") else url
+    return get_request_session().request(method, url, **kwargs)
 
 
 @cache_region("request")
@@ -1942,6 +1989,9 @@ def request_extra(method,                           # type: AnyRequestMethod
 
         delay = backoff * (2 ^ retry)
 
+    The computed delay is randomized between half and its full value (jitter) to avoid many clients retrying their
+    requests simultaneously against a recovering server.
+
     Alternatively, you can explicitly define ``intervals=[...]`` with the list values being the number of seconds to
     wait between each request attempt. In this case, :paramref:`backoff` is ignored and :paramref:`retries` is
     overridden accordingly with the number of items specified in the list.
@@ -2028,7 +2078,10 @@ def request_extra(method,                           # type: AnyRequestMethod
     if intervals and len(intervals) and all(isinstance(i, (int, float)) for i in intervals):
         request_delta = [0] + intervals
     else:
-        request_delta = [0] + [(backoff * (2 ** (retry + 1))) for retry in range(retries)]
+        request_delta = [0] + [
+            delay / 2 + random.uniform(0, delay / 2)  # nosec: B311  # jitter, not for security purposes
+            for delay in (backoff * (2 ** (retry + 1)) for retry in range(retries))
+        ]
     no_retries = len(request_delta) == 1
     # SSL verification settings
     # ON by default, disable accordingly with any variant if matched
@@ -3584,6 +3637,19 @@ def create_metalink(
     return meta_link
 
 
+@functools.lru_cache(maxsize=64)
+def _load_file_parsed(file_path, file_mtime, file_size):
+    # type: (str, int, int) -> JSON
+    """
+    Parses the :term:`JSON` or :term:`YAML` local file contents, memoized until the file is modified.
+
+    The modification time and size of the file are not used directly, but ensure that the cached contents are parsed
+    again whenever the file is updated. Returned contents must not be modified since they are shared between calls.
+    """
+    with open(file_path, mode="r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=YamlSafeLoader)  # nosec: B506  # safe loader
+
+
 def load_file(file_path, text=False):
     # type: (str, bool) -> Union[JSON, str]
     """
@@ -3591,6 +3657,9 @@ def load_file(file_path, text=False):
 
     If URL, get the content and validate it by loading, otherwise load file directly.
 
+    .. note::
+        Parsed contents of local files are memoized until the file is modified. A copy is returned for each call.
+
     :param file_path: Local path or URL endpoint where file to load is located.
     :param text: load contents as plain text rather than parsing it from :term:`JSON`/:term:`YAML`.
     :returns: loaded contents either parsed and converted to Python objects or as plain text.
@@ -3601,9 +3670,12 @@ def load_file(file_path, text=False):
             settings = get_settings()
             headers = {"Accept": ContentType.TEXT_PLAIN}
             cwl_resp = request_extra("GET", file_path, headers=headers, settings=settings)
-            return cwl_resp.content if text else yaml.safe_load(cwl_resp.content)
+            return cwl_resp.content if text else yaml.load(cwl_resp.content, Loader=YamlSafeLoader)  # nosec: B506
+        if not text:
+            file_stat = os.stat(file_path)
+            return deepcopy(_load_file_parsed(file_path, file_stat.st_mtime_ns, file_stat.st_size))
         with open(file_path, mode="r", encoding="utf-8") as f:
-            return f.read() if text else yaml.safe_load(f)
+            return f.read()
     except OSError as exc:
         LOGGER.debug("Loading error: %s", exc, exc_info=exc)
         raise
@@ -3617,7 +3689,7 @@ def is_remote_file(file_location):
     """
     Parses to file location to figure out if it is remotely available or a local path.
     """
-    cwl_file_path_or_url = file_location.replace("file://", "")
+    cwl_file_path_or_url = file_location[7:] if file_location.startswith("file://") else file_location
     scheme = urlparse(cwl_file_path_or_url).scheme
     return scheme != "" and not posixpath.ismount(f"{scheme}:")  # windows partition
 
@@ -3657,12 +3729,14 @@ def get_sane_name(name, min_len=3, max_len=None, assert_invalid=True, replace_ch
     max_len = max_len or len(name)
     if assert_invalid:
         assert_sane_name(name, min_len, max_len)
+        # validated name already contains only allowed characters within length limits, nothing to replace
+        return name.strip()
     if name is None:
         return None
     name = name.strip()
     if len(name) < min_len:
         return None
-    name = re.sub(REGEX_SEARCH_INVALID_CHARACTERS, replace_character, name[:max_len])
+    name = REGEX_SEARCH_INVALID_CHARACTERS.sub(replace_character, name[:max_len])
     return name
 
 
@@ -3685,7 +3759,7 @@ def assert_sane_name(name, min_len=3, max_len=None):
         or name.endswith("-")
         or len(name) < min_len
         or (max_len is not None and len(name) > max_len)
-        or not re.match(REGEX_ASSERT_INVALID_CHARACTERS, name)
+        or not REGEX_ASSERT_INVALID_CHARACTERS.match(name)
     ):
         raise InvalidIdentifierValue(f"Invalid name : {name}")
 
@@ -3802,10 +3876,12 @@ def transform_json(json_data,               # type: Dict[str, JSON]
         json_data[k] = v
 
     # replace values
-    for key, value in json_data.items():
-        for old_value, new_value in replace_values.items():
-            if value == old_value:
-                json_data[key] = new_value
+    if replace_values:
+        for key, value in json_data.items():
+            try:
+                json_data[key] = replace_values[value]
+            except (KeyError, TypeError):  # no match or unhashable value (list, dict, etc.) that cannot be a match
+                pass
 
     # replace with function call
     for k, func in replace_func.items():
@@ -3813,6 +3889,8 @@ def transform_json(json_data,               # type: Dict[str, JSON]
             json_data[k] = func(json_data[k])
 
     # also rename if the type of the value is a list of dicts
+    if not rename and not replace_func:
+        return json_data
     for key, value in json_data.items():
         if isinstance(value, list):
             for nested_item in value:
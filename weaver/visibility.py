@@ -8,6 +8,8 @@ class Visibility(Constants):
     PRIVATE = "private"
 
 
+VISIBILITY_VALUES = frozenset(Visibility.values())
+
 if TYPE_CHECKING:
     from weaver.typedefs import Literal
 
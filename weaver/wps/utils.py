@@ -4,6 +4,7 @@ import os
 import re
 import tempfile
 from configparser import ConfigParser
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
@@ -38,9 +39,24 @@ from weaver.wps_restapi import swagger_definitions as sd
 LOGGER = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from typing import Dict, Optional, Union
+    from urllib.parse import ParseResult
 
     from weaver.typedefs import AnyAcceptLanguageHeader, AnyRequestType, AnySettingsContainer, HeadersType, ProcessOWS
 
+# sub-directory names separated by single slashes, with optional trailing slash (no nested quantifier to backtrack)
+REGEX_WPS_OUTPUT_CONTEXT = re.compile(r"\A[\w-]+(?:/[\w-]+)*/?\Z")
+# headers recomputed by the WPS client, compared in lowercase with underscores to match any variant
+WPS_CLIENT_IGNORE_HEADERS = frozenset(["accept", "content_length", "content_type", "content_transfer_encoding"])
+
+
+@lru_cache(maxsize=64)
+def _parse_url_cached(url):
+    # type: (str) -> ParseResult
+    """
+    Parses the URL of configured WPS locations, which are repeatedly resolved with the same values for each request.
+    """
+    return urlparse(url)
+
 
 def _get_settings_or_wps_config(container,                  # type: AnySettingsContainer
                                 weaver_setting_name,        # type: str
@@ -73,7 +89,7 @@ def get_wps_path(container, load=True):
     Searches directly in settings, then `weaver.wps_cfg` file, or finally, uses the default values if not found.
     """
     path = _get_settings_or_wps_config(container, "weaver.wps_path", "server", "url", "/ows/wps", "WPS path", load)
-    return urlparse(path).path
+    return _parse_url_cached(path).path
 
 
 def get_wps_url(container, load=True):
@@ -105,7 +121,8 @@ def get_wps_output_path(container, load=True):
 
     Searches directly in settings, then `weaver.wps_cfg` file, or finally, uses the default values if not found.
     """
-    return get_settings(container).get("weaver.wps_output_path") or urlparse(get_wps_output_url(container, load)).path
+    wps_output_path = get_settings(container).get("weaver.wps_output_path")
+    return wps_output_path or _parse_url_cached(get_wps_output_url(container, load)).path
 
 
 def get_wps_output_url(container, load=True):
@@ -115,11 +132,11 @@ def get_wps_output_url(container, load=True):
 
     Searches directly in settings, then `weaver.wps_cfg` file, or finally, uses the default values if not found.
     """
-    wps_output_default = f"{get_weaver_url(container)}/wpsoutputs"
     wps_output_config = _get_settings_or_wps_config(
-        container, "weaver.wps_output_url", "server", "outputurl", wps_output_default, "WPS output url", load
+        container, "weaver.wps_output_url", "server", "outputurl", "", "WPS output url", load
     )
-    return wps_output_config or wps_output_default
+    # default only generated when needed since configured value is commonly available
+    return wps_output_config or f"{get_weaver_url(container)}/wpsoutputs"
 
 
 def get_wps_output_context(request):
@@ -139,8 +156,7 @@ def get_wps_output_context(request):
             return None
         LOGGER.debug("Using default 'wps.wps_output_context': %s", ctx_default)
         ctx = ctx_default
-    cxt_found = re.match(r"^(?=[\w-]+)([\w-]+/?)+$", ctx)
-    if cxt_found and cxt_found[0] == ctx:
+    if REGEX_WPS_OUTPUT_CONTEXT.match(ctx):
         ctx_matched = ctx[:-1] if ctx.endswith("/") else ctx
         LOGGER.debug("Using request 'X-WPS-Output-Context': %s", ctx_matched)
         return ctx_matched
@@ -169,7 +185,7 @@ def get_wps_local_status_location(url_status_location, container, must_exist=Tru
         req_out_url = get_url_without_query(url_status_location)
         out_path = os.path.join(dir_path, req_out_url.replace(wps_out_url, "").lstrip("/"))
     else:
-        out_path = url_status_location.replace("file://", "")
+        out_path = url_status_location[7:] if url_status_location.startswith("file://") else url_status_location
     found = os.path.isfile(out_path)
     if not found and "/jobs/" in url_status_location:
         job_uuid = url_status_location.rsplit("/jobs/", 1)[-1].split("/", 1)[0]
@@ -213,11 +229,11 @@ def map_wps_output_location(reference, container, url=False, exists=True, file_s
     if url and reference.startswith("file://"):
         reference = reference[7:]
     if url and reference.startswith(wps_out_dir):
-        wps_out_ref = reference.replace(wps_out_dir, wps_out_url, 1)
+        wps_out_ref = wps_out_url + reference[len(wps_out_dir):]
         if not exists or ref_exists(reference):
             return wps_out_ref
     elif not url and reference.startswith(wps_out_url):
-        wps_out_ref = reference.replace(wps_out_url, wps_out_dir, 1)
+        wps_out_ref = wps_out_dir + reference[len(wps_out_url):]
         if not exists or ref_exists(wps_out_ref):
             if file_scheme:
                 return f"file://{wps_out_ref}"
@@ -267,20 +283,25 @@ def get_wps_client(url, container=None, verify=None, headers=None, language=None
     # employ the provided headers instead of making new ones in order to forward any language/authorization definition
     # copy to avoid modify original headers for sub-requests for next steps that could use them
     # employ dict() rather than deepcopy since headers that can be an instance of EnvironHeaders cannot be serialized
-    headers = dict(headers)
-    for header in ["Accept", "Content-Length", "Content-Type", "Content-Transfer-Encoding"]:
-        hdr_low = header.lower()
-        for hdr in [header, hdr_low, header.replace("-", "_"), hdr_low.replace("-", "_")]:
-            headers.pop(hdr, None)
+    # sort headers to generate the same caching key regardless of their original order
+    # retrieve the language at the same time to avoid another lookup with the same header name normalization
+    wps_headers = {}
+    header_language = None
+    for hdr, val in sorted(headers.items()):
+        hdr_name = hdr.lower().replace("-", "_")
+        if hdr_name in WPS_CLIENT_IGNORE_HEADERS:
+            continue
+        if hdr_name == "accept_language":
+            header_language = val
+        wps_headers[hdr] = val
+    headers = wps_headers
     opts = get_request_options("get", url, container)
     if verify is None:
         verify = get_ssl_verify_option("get", url, container, request_options=opts)
     # convert objects to allow caching keys against values (object instances always different)
-    language = language or getattr(container, "accept_language", None) or get_header("Accept-Language", headers)
+    language = language or getattr(container, "accept_language", None) or header_language
     if language is not None and not isinstance(language, str):
         language = str(language)
-    if headers is not None and not isinstance(headers, dict):
-        headers = dict(headers)
     request_args = (url, headers, verify, language)
     if get_no_cache_option(headers, request_options=opts):
         for func in (_get_wps_client_cached, _describe_process_cached):
@@ -307,13 +328,13 @@ def check_wps_status(location=None,     # type: Optional[str]
     :returns: OWSLib.wps.WPSExecution object.
     """
     def _retry_file():
-        # type: () -> str
+        # type: () -> bytes
         LOGGER.warning("Failed retrieving WPS status-location, attempting with local file.")
         out_path = get_wps_local_status_location(location, settings)
         if not out_path:
             raise HTTPNotFound(f"Could not find file resource from [{location}].")
         LOGGER.info("Resolved WPS status-location using local file reference.")
-        with open(out_path, mode="r", encoding="utf-8") as f:
+        with open(out_path, mode="rb") as f:  # avoid decode/encode round-trip, parser expects bytes
             return f.read()
 
     execution = WPSExecution()
@@ -412,9 +433,10 @@ def load_pywps_config(container, config=None):
 
     # update metadata
     LOGGER.debug("Updating WPS metadata configuration.")
+    metadata_prefix = "weaver.wps_metadata_"
     for setting_name, setting_value in settings.items():
-        if setting_name.startswith("weaver.wps_metadata"):
-            pywps_setting = setting_name.replace("weaver.wps_metadata_", "")
+        if setting_name.startswith(metadata_prefix):
+            pywps_setting = setting_name[len(metadata_prefix):]
             pywps_config.CONFIG.set("metadata:main", pywps_setting, setting_value)
     # add weaver configuration keyword if not already provided
     wps_keywords = pywps_config.CONFIG.get("metadata:main", "identification_keywords")
@@ -540,10 +562,17 @@ def set_wps_language(wps, accept_language=None, request=None):
         # owslib version doesn't support setting a language
         return
 
+    supported_languages = wps.languages.supported or AcceptLanguage.offers()
     if isinstance(accept_language, str):
+        # common case of a single language tag exactly matching a supported one, no need for header parsing
+        if "," not in accept_language and ";" not in accept_language:
+            accept_lang_lower = accept_language.strip().lower()
+            for lang in supported_languages:
+                if lang.lower() == accept_lang_lower:
+                    wps.language = lang
+                    return lang
         accept_language = create_accept_language_header(accept_language)  # type: AnyAcceptLanguageHeader
 
-    supported_languages = wps.languages.supported or AcceptLanguage.offers()
     language = accept_language.lookup(supported_languages, default="") or None
     if language:
         wps.language = language
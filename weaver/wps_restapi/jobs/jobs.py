@@ -88,7 +88,7 @@ def get_queried_jobs(request):
     LOGGER.debug("Job search queries (processed):\n%s", repr_json(filters, indent=2))
 
     store = get_db(request).get_store(StoreJobs)
-    items, total = store.find_jobs(request=request, group_by=groups, **filters)
+    items, total = store.find_jobs(request=request, group_by=groups, summary=True, **filters)
     body = {"total": total}
 
     def _job_list(_jobs):  # type: (Iterable[Job]) -> List[JSON]
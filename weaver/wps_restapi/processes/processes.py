@@ -325,7 +325,7 @@ def delete_local_process(request):
             "cause": {"mutable": False}
         })
     job_store = db.get_store(StoreJobs)
-    jobs, total = job_store.find_jobs(process=process_id, status=Status.RUNNING, page=None, limit=None)
+    jobs, total = job_store.find_jobs(process=process_id, status=Status.RUNNING, page=None, limit=None, summary=True)
     if total != 0:
         raise HTTPForbidden(json={
             "title": "ProcessBusy",
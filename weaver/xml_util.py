@@ -24,7 +24,7 @@ from owslib.wps import etree as owslib_wps_etree
 
 if TYPE_CHECKING:
     from io import BufferedReader
-    from typing import Any, AnyStr, Union
+    from typing import Any, AnyStr, Iterator, Tuple, Union
 
 
 XML_PARSER = lxml_etree.XMLParser(
@@ -64,6 +64,15 @@ def parse(source, parser=XML_PARSER):
     return lxml_etree.parse(source, parser=parser)  # nosec: B410
 
 
+def iterparse(source, **kwargs):
+    # type: (Union[str, BufferedReader], **Any) -> Iterator[Tuple[str, XML]]
+    """
+    Incrementally parses the XML source, applying the same security options as the default :data:`XML_PARSER`.
+    """
+    kwargs.update({"resolve_entities": False, "recover": True})
+    return lxml_etree.iterparse(source, **kwargs)  # nosec: B410
+
+
 # override OWSLib call with adjusted method reference with configured parser enforced
 owslib_wps_etree.fromstring = fromstring
 